@@ -0,0 +1,52 @@
+-- Migration: Add precomputed question_stats row
+-- Description: Single-row summary of question counts so /api/questions/stats
+--              does not aggregate questions and question_tags on every request.
+--              Written by utils/generate_questions.py; refreshed from the tables
+--              with SELECT refresh_question_stats();
+
+CREATE TABLE IF NOT EXISTS question_stats (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    total_questions INTEGER NOT NULL DEFAULT 0,
+    easy_count INTEGER NOT NULL DEFAULT 0,
+    medium_count INTEGER NOT NULL DEFAULT 0,
+    hard_count INTEGER NOT NULL DEFAULT 0,
+    custom_questions INTEGER NOT NULL DEFAULT 0,
+    leetcode_questions INTEGER NOT NULL DEFAULT 0,
+    tag_counts JSONB NOT NULL DEFAULT '{}',
+    category_counts JSONB NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Recompute question_stats from questions and question_tags.
+-- category_counts is left as-is: categories only exist in the seed catalogue.
+CREATE OR REPLACE FUNCTION refresh_question_stats()
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO question_stats (id, total_questions, easy_count, medium_count, hard_count,
+                                custom_questions, leetcode_questions, tag_counts, updated_at)
+    SELECT
+        TRUE,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE difficulty = 'Easy'),
+        COUNT(*) FILTER (WHERE difficulty = 'Medium'),
+        COUNT(*) FILTER (WHERE difficulty = 'Hard'),
+        COUNT(*) FILTER (WHERE is_custom = TRUE),
+        COUNT(*) FILTER (WHERE is_custom = FALSE),
+        (SELECT COALESCE(jsonb_object_agg(tag, count), '{}')
+         FROM (SELECT tag, COUNT(*) AS count FROM question_tags GROUP BY tag) t),
+        NOW()
+    FROM questions
+    ON CONFLICT (id) DO UPDATE SET
+        total_questions = EXCLUDED.total_questions,
+        easy_count = EXCLUDED.easy_count,
+        medium_count = EXCLUDED.medium_count,
+        hard_count = EXCLUDED.hard_count,
+        custom_questions = EXCLUDED.custom_questions,
+        leetcode_questions = EXCLUDED.leetcode_questions,
+        tag_counts = EXCLUDED.tag_counts,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ language 'plpgsql';
+
+-- Populate from existing data
+SELECT refresh_question_stats();
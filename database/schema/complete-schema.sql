@@ -11,6 +11,7 @@ DROP TABLE IF EXISTS user_question_progress CASCADE;
 DROP TABLE IF EXISTS user_path_enrollments CASCADE;
 DROP TABLE IF EXISTS path_questions CASCADE;
 DROP TABLE IF EXISTS question_tags CASCADE;
+DROP TABLE IF EXISTS question_stats CASCADE;
 DROP TABLE IF EXISTS path_tags CASCADE;
 DROP TABLE IF EXISTS questions CASCADE;
 DROP TABLE IF EXISTS learning_paths CASCADE;
@@ -114,6 +115,20 @@ CREATE TABLE question_tags (
 CREATE INDEX idx_question_tags_question_id ON question_tags(question_id);
 CREATE INDEX idx_question_tags_tag ON question_tags(tag);
 
+-- Question Stats (single precomputed row, written by the seed generator)
+CREATE TABLE question_stats (
+  id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+  total_questions INTEGER NOT NULL DEFAULT 0,
+  easy_count INTEGER NOT NULL DEFAULT 0,
+  medium_count INTEGER NOT NULL DEFAULT 0,
+  hard_count INTEGER NOT NULL DEFAULT 0,
+  custom_questions INTEGER NOT NULL DEFAULT 0,
+  leetcode_questions INTEGER NOT NULL DEFAULT 0,
+  tag_counts JSONB NOT NULL DEFAULT '{}',
+  category_counts JSONB NOT NULL DEFAULT '{}',
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
 -- Path Questions (Junction Table with Ordering)
 CREATE TABLE path_questions (
   id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -238,6 +253,37 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
+-- Recompute question_stats from questions and question_tags.
+-- category_counts is left as-is: categories only exist in the seed catalogue.
+CREATE OR REPLACE FUNCTION refresh_question_stats()
+RETURNS VOID AS $$
+BEGIN
+  INSERT INTO question_stats (id, total_questions, easy_count, medium_count, hard_count,
+                              custom_questions, leetcode_questions, tag_counts, updated_at)
+  SELECT
+    TRUE,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE difficulty = 'Easy'),
+    COUNT(*) FILTER (WHERE difficulty = 'Medium'),
+    COUNT(*) FILTER (WHERE difficulty = 'Hard'),
+    COUNT(*) FILTER (WHERE is_custom = TRUE),
+    COUNT(*) FILTER (WHERE is_custom = FALSE),
+    (SELECT COALESCE(jsonb_object_agg(tag, count), '{}')
+     FROM (SELECT tag, COUNT(*) AS count FROM question_tags GROUP BY tag) t),
+    NOW()
+  FROM questions
+  ON CONFLICT (id) DO UPDATE SET
+    total_questions = EXCLUDED.total_questions,
+    easy_count = EXCLUDED.easy_count,
+    medium_count = EXCLUDED.medium_count,
+    hard_count = EXCLUDED.hard_count,
+    custom_questions = EXCLUDED.custom_questions,
+    leetcode_questions = EXCLUDED.leetcode_questions,
+    tag_counts = EXCLUDED.tag_counts,
+    updated_at = EXCLUDED.updated_at;
+END;
+$$ language 'plpgsql';
+
 -- Apply update triggers
 CREATE TRIGGER update_users_updated_at
   BEFORE UPDATE ON users
@@ -274,6 +320,7 @@ CREATE TRIGGER update_user_settings_updated_at
 COMMENT ON TABLE users IS 'User accounts with authentication and profile information';
 COMMENT ON TABLE learning_paths IS 'Curated learning paths containing sequences of questions';
 COMMENT ON TABLE questions IS 'LeetCode questions and custom practice problems';
+COMMENT ON TABLE question_stats IS 'Precomputed question counts; refresh with SELECT refresh_question_stats()';
 COMMENT ON TABLE user_path_enrollments IS 'Tracks which paths users are actively studying';
 COMMENT ON TABLE user_question_progress IS 'Individual question progress and review status';
 COMMENT ON TABLE daily_recommendations IS 'Daily question recommendations for each user';
@@ -69,16 +69,20 @@ psql -h $DB_HOST -p $DB_PORT -U $DB_USER -d $DB_NAME -f "$(dirname "$0")/../seed
 
 echo "✅ Learning paths created"
 
+# Precompute question statistics
+psql -h $DB_HOST -p $DB_PORT -U $DB_USER -d $DB_NAME -c "SELECT refresh_question_stats();" > /dev/null
+
 # Display statistics
 echo "📊 Database statistics:"
 psql -h $DB_HOST -p $DB_PORT -U $DB_USER -d $DB_NAME -c "
 SELECT
-    (SELECT COUNT(*) FROM questions) as total_questions,
-    (SELECT COUNT(*) FROM questions WHERE difficulty = 'Easy') as easy_questions,
-    (SELECT COUNT(*) FROM questions WHERE difficulty = 'Medium') as medium_questions,
-    (SELECT COUNT(*) FROM questions WHERE difficulty = 'Hard') as hard_questions,
+    total_questions,
+    easy_count as easy_questions,
+    medium_count as medium_questions,
+    hard_count as hard_questions,
     (SELECT COUNT(*) FROM learning_paths) as total_paths,
-    (SELECT COUNT(DISTINCT tag) FROM question_tags) as unique_tags;
+    (SELECT COUNT(*) FROM jsonb_object_keys(tag_counts)) as unique_tags
+FROM question_stats;
 "
 
 echo ""
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark the seed pipeline on synthetic catalogues shaped like questions_data
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from catalogue import Catalogue, create_slug, escape_sql_string
+from db_loader import psql
+from generate_questions import category_tags_map, generate_copy, generate_sql, generate_upsert, write_sql
+from seed_profile import SeedProfile
+
+SCHEMA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "schema", "complete-schema.sql")
+
+DEFAULT_SIZES = [150, 3000, 100000, 1000000]
+MODES = ["insert", "copy", "upsert"]
+
+def synthesize_catalogue(size):
+    """Build a questions_data-shaped dict with size questions spread over the real categories"""
+    categories = list(category_tags_map)
+    difficulties = ["Easy", "Medium", "Medium", "Hard"]
+    data = {category: [] for category in categories}
+
+    for i in range(size):
+        category = categories[i % len(categories)]
+        # Every seventh title has a quote so the escaping paths get exercised
+        title = f"Bob's Synthetic Problem {i + 1}" if i % 7 == 0 else f"Synthetic Problem {i + 1}"
+        description = f"Given an integer array nums of length {i + 1}, return the answer for the {category} variant of this problem."
+        data[category].append((i + 1, title, difficulties[i % len(difficulties)], description))
+
+    return data
+
+def time_load(sql_path):
+    """Load sql_path into a throwaway database and return the load time in seconds"""
+    database = f"leettrack_bench_{os.getpid()}"
+    quiet = {"check": True, "stdout": subprocess.DEVNULL}
+    psql("-c", f"CREATE DATABASE {database}", dbname="postgres", **quiet)
+
+    try:
+        psql("-f", SCHEMA_FILE, dbname=database, **quiet)
+        start = time.perf_counter()
+        psql("-1", "-f", sql_path, dbname=database, **quiet)
+        return time.perf_counter() - start
+    finally:
+        psql("-c", f"DROP DATABASE IF EXISTS {database}", dbname="postgres", **quiet)
+
+def run_case(size, mode, batch_size, load):
+    """Time every stage for one catalogue size and output mode; runs in a fresh process"""
+    profile = SeedProfile(mode=mode, questions=size, batch_size=batch_size)
+
+    with profile.stage("synthesize"):
+        data = synthesize_catalogue(size)
+
+    rows = [row for questions in data.values() for row in questions]
+
+    with profile.stage("slugging"):
+        for leetcode_id, title, difficulty, description in rows:
+            create_slug(title)
+
+    with profile.stage("escaping"):
+        for leetcode_id, title, difficulty, description in rows:
+            escape_sql_string(title)
+            escape_sql_string(description)
+
+    del rows
+
+    with profile.stage("catalogue"):
+        catalogue = Catalogue(data, category_tags_map)
+
+    if mode == "copy":
+        chunks = generate_copy(catalogue)
+    elif mode == "upsert":
+        chunks = generate_upsert(catalogue, batch_size)
+    else:
+        chunks = generate_sql(catalogue)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sql_path = os.path.join(tmp, "seed.sql")
+
+        with profile.stage("write"):
+            write_sql(profile.count(chunks), sql_path)
+        profile.stages["write"] -= profile.stages["render"]
+
+        report = profile.report()
+
+        if load:
+            report["load_seconds"] = round(time_load(sql_path), 6)
+
+    return report
+
+def format_row(report):
+    """One line of the summary table"""
+    stages = report["stages"]
+    return (
+        f"{report['questions']:>9} {report['mode']:<7}"
+        f" slug {stages['slugging']:8.3f}s  escape {stages['escaping']:8.3f}s"
+        f"  catalogue {stages['catalogue']:8.3f}s  render {stages['render']:8.3f}s  write {stages['write']:8.3f}s"
+        f"  {report['statements']:>9} stmts  {report['output_bytes'] / 1e6:9.2f} MB"
+        f"  peak {report['peak_rss_bytes'] / 1e6:8.1f} MB"
+        + (f"  load {report['load_seconds']:8.3f}s" if "load_seconds" in report else "")
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark seed generation on synthetic catalogues")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="comma-separated catalogue sizes (default 150,3000,100000,1000000)")
+    parser.add_argument("--modes", default=",".join(MODES),
+                        help="comma-separated output modes to compare (default insert,copy,upsert)")
+    parser.add_argument("--batch-size", type=int, default=500,
+                        help="rows per statement for upsert mode (default 500)")
+    parser.add_argument("--load", action="store_true",
+                        help="also time loading each script into a throwaway database (uses DB_HOST/DB_PORT/DB_USER)")
+    parser.add_argument("--json", metavar="PATH",
+                        help="write all reports as a JSON list to PATH")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    modes = args.modes.split(",")
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown modes: {', '.join(sorted(unknown))}")
+
+    reports = []
+
+    # Each case gets a fresh interpreter so peak RSS belongs to that case alone
+    context = multiprocessing.get_context("spawn")
+
+    for size in sizes:
+        for mode in modes:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                try:
+                    report = pool.submit(run_case, size, mode, args.batch_size, args.load).result()
+                except subprocess.CalledProcessError as e:
+                    print(f"Load failed: {e}", file=sys.stderr)
+                    sys.exit(1)
+
+            reports.append(report)
+            print(format_row(report), flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+            f.write("\n")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Indexed in-memory model of a question catalogue, shared by the seed generators
+"""
+
+import re
+import uuid
+
+# Mirrors the questions table constraints in schema/complete-schema.sql
+VALID_SLUG = re.compile(r"^[a-z0-9-]+$")
+VALID_DIFFICULTIES = ("Easy", "Medium", "Hard")
+MAX_TAG_LENGTH = 50
+MULTIPLE_HYPHENS = re.compile(r"-{2,}")
+
+# Namespace for client-side question ids, so the same slug always maps to the same UUID
+QUESTION_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://leetcode.com/problems/")
+
+class CatalogueError(ValueError):
+    """Raised when a catalogue row would violate the questions schema"""
+
+def create_slug(title):
+    """Convert title to URL slug; runs of hyphens collapse to one, as in LeetCode's own slugs"""
+    slug = title.lower().replace(" ", "-").replace("(", "").replace(")", "").replace(",", "").replace("'", "").replace(".", "").replace("/", "-")
+    return MULTIPLE_HYPHENS.sub("-", slug)
+
+def escape_sql_string(s):
+    """Escape single quotes in SQL strings"""
+    return s.replace("'", "''")
+
+def escape_copy_value(s):
+    """Escape a value for COPY text format (tab-separated)"""
+    return s.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+def question_uuid(slug):
+    """Deterministic question id derived from slug"""
+    return str(uuid.uuid5(QUESTION_ID_NAMESPACE, slug))
+
+class Question:
+    """One catalogue row with its derived values computed once"""
+
+    __slots__ = (
+        "leetcode_id", "title", "slug", "difficulty", "description", "category", "tags",
+        "url", "uuid", "title_sql", "description_sql", "tags_sql",
+    )
+
+    def __init__(self, leetcode_id, title, difficulty, description, category, tags):
+        self.leetcode_id = leetcode_id
+        self.title = title
+        self.slug = create_slug(title)
+        self.difficulty = difficulty
+        self.description = description
+        self.category = category
+        self.tags = tuple(tags)
+        self.url = f"https://leetcode.com/problems/{self.slug}/"
+        self.uuid = question_uuid(self.slug)
+        self.title_sql = escape_sql_string(title)
+        self.description_sql = escape_sql_string(description)
+        self.tags_sql = tuple(escape_sql_string(tag) for tag in self.tags)
+
+    def __repr__(self):
+        return f"Question({self.leetcode_id}, {self.slug!r})"
+
+class Catalogue:
+    """Questions in catalogue order plus hash indexes by leetcode_id, slug, category, tag and difficulty"""
+
+    def __init__(self, questions_data, category_tags_map):
+        self.questions = []
+        self.by_leetcode_id = {}
+        self.by_slug = {}
+        self.by_category = {}
+        self.by_tag = {}
+        self.by_difficulty = {}
+
+        for category, rows in questions_data.items():
+            tags = category_tags_map.get(category, [category])
+            self.by_category.setdefault(category, [])
+
+            for leetcode_id, title, difficulty, description in rows:
+                self.add(Question(leetcode_id, title, difficulty, description, category, tags))
+
+    def add(self, question):
+        """Validate and index one question"""
+        if not VALID_SLUG.match(question.slug):
+            raise CatalogueError(f"Question {question.leetcode_id} ({question.title!r}) has invalid slug {question.slug!r}")
+        if question.slug in self.by_slug:
+            raise CatalogueError(f"Duplicate slug {question.slug!r} for questions {self.by_slug[question.slug].leetcode_id} and {question.leetcode_id}")
+        if question.leetcode_id in self.by_leetcode_id:
+            raise CatalogueError(f"Duplicate leetcode_id {question.leetcode_id}")
+        if question.difficulty not in VALID_DIFFICULTIES:
+            raise CatalogueError(f"Question {question.leetcode_id} has invalid difficulty {question.difficulty!r}")
+        if len(question.title.strip()) < 3:
+            raise CatalogueError(f"Question {question.leetcode_id} title is shorter than 3 characters")
+        for tag in question.tags:
+            if len(tag) > MAX_TAG_LENGTH:
+                raise CatalogueError(f"Question {question.leetcode_id} tag {tag!r} is longer than {MAX_TAG_LENGTH} characters")
+
+        self.questions.append(question)
+        self.by_leetcode_id[question.leetcode_id] = question
+        self.by_slug[question.slug] = question
+        self.by_category.setdefault(question.category, []).append(question)
+        self.by_difficulty.setdefault(question.difficulty, []).append(question)
+
+        for tag in question.tags:
+            self.by_tag.setdefault(tag, []).append(question)
+
+    def __len__(self):
+        return len(self.questions)
+
+    def __iter__(self):
+        return iter(self.questions)
+
+    def __contains__(self, slug):
+        return slug in self.by_slug
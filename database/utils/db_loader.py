@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Load a catalogue straight into PostgreSQL with the COPY protocol
+"""
+
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+# Staging tables are per-connection and dropped at commit, so partitions never see each other's rows
+STAGE_SQL = """
+CREATE TEMP TABLE seed_questions (
+  leetcode_id VARCHAR(10),
+  title TEXT,
+  slug TEXT,
+  difficulty TEXT,
+  description TEXT,
+  url TEXT
+) ON COMMIT DROP;
+CREATE TEMP TABLE seed_question_tags (
+  slug TEXT,
+  tag TEXT
+) ON COMMIT DROP;
+"""
+
+# Rows whose slug changed (e.g. seeded under an older slug) move by leetcode_id before the slug merge
+SYNC_SLUGS_SQL = """
+UPDATE questions q SET slug = s.slug, title = s.title, url = s.url
+FROM seed_questions s
+WHERE q.leetcode_id = s.leetcode_id AND q.slug <> s.slug
+"""
+
+MERGE_QUESTIONS_SQL = """
+INSERT INTO questions (leetcode_id, title, slug, difficulty, description, url, is_custom)
+SELECT leetcode_id, title, slug, difficulty::question_difficulty, description, url, FALSE
+FROM seed_questions
+ON CONFLICT (slug) DO UPDATE SET
+  leetcode_id = EXCLUDED.leetcode_id,
+  title = EXCLUDED.title,
+  difficulty = EXCLUDED.difficulty,
+  description = EXCLUDED.description,
+  url = EXCLUDED.url
+"""
+
+MERGE_TAGS_SQL = """
+INSERT INTO question_tags (question_id, tag)
+SELECT q.id, t.tag FROM seed_question_tags t JOIN questions q USING (slug)
+ON CONFLICT DO NOTHING
+"""
+
+def connection_params():
+    """Connection keyword arguments from the same DB_* variables as setup_complete.sh"""
+    params = {
+        "host": os.environ.get("DB_HOST", "localhost"),
+        "port": os.environ.get("DB_PORT", "5432"),
+        "dbname": os.environ.get("DB_NAME", "leettrack"),
+        "user": os.environ.get("DB_USER", "leettrack_user"),
+    }
+    if "DB_PASSWORD" in os.environ:
+        params["password"] = os.environ["DB_PASSWORD"]
+
+    # Passed as keyword arguments so psycopg does the quoting (passwords may contain spaces or quotes)
+    return params
+
+def psql(*args, dbname=None, **kwargs):
+    """Run psql with connection_params(); dbname overrides DB_NAME and kwargs go to subprocess.run"""
+    params = connection_params()
+    command = [
+        "psql",
+        "-h", params["host"],
+        "-p", params["port"],
+        "-U", params["user"],
+        "-d", dbname or params["dbname"],
+        "-v", "ON_ERROR_STOP=1",
+        "-q",
+        *args,
+    ]
+    env = dict(os.environ)
+    if "password" in params:
+        env.setdefault("PGPASSWORD", params["password"])
+
+    return subprocess.run(command, env=env, **kwargs)
+
+def load_partition(pool, questions, finalize_sql=None):
+    """COPY one partition into staging tables and merge it, in a single transaction"""
+    with pool.connection() as conn:
+        with conn.transaction(), conn.cursor() as cur:
+            cur.execute(STAGE_SQL)
+
+            with cur.copy("COPY seed_questions (leetcode_id, title, slug, difficulty, description, url) FROM STDIN") as copy:
+                for q in questions:
+                    copy.write_row((str(q.leetcode_id), q.title, q.slug, q.difficulty, q.description, q.url))
+
+            with cur.copy("COPY seed_question_tags (slug, tag) FROM STDIN") as copy:
+                for q in questions:
+                    for tag in q.tags:
+                        copy.write_row((q.slug, tag))
+
+            cur.execute(SYNC_SLUGS_SQL)
+            cur.execute(MERGE_QUESTIONS_SQL)
+            cur.execute(MERGE_TAGS_SQL)
+
+            if finalize_sql:
+                cur.execute(finalize_sql)
+
+    return len(questions)
+
+def load_partitions(partitions, jobs=1, finalize_sql=None):
+    """Upsert disjoint lists of questions over a pool of up to jobs connections, one transaction per list.
+
+    finalize_sql (e.g. the question_stats refresh) runs once after every partition has merged.
+    """
+    try:
+        from psycopg_pool import ConnectionPool
+    except ImportError:
+        raise RuntimeError('Direct loading needs psycopg 3 with its pool: pip install "psycopg[binary,pool]"')
+
+    with ConnectionPool("", kwargs=connection_params(), min_size=1, max_size=jobs, open=True) as pool:
+        if len(partitions) == 1:
+            return load_partition(pool, partitions[0], finalize_sql)
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            loaded = sum(executor.map(lambda questions: load_partition(pool, questions), partitions))
+
+        if finalize_sql:
+            with pool.connection() as conn:
+                conn.execute(finalize_sql)
+
+        return loaded
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Enrich catalogue questions with topic tags and difficulty from the LeetCode GraphQL API
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+import urllib.error
+import urllib.request
+
+from catalogue import MAX_TAG_LENGTH, VALID_DIFFICULTIES, Catalogue, Question
+
+LEETCODE_ENDPOINT = "https://leetcode.com/graphql"
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".enrich_cache")
+DEFAULT_TTL = 7 * 24 * 3600
+
+# Trimmed version of the questionDetails query in lib/leetcode-client.ts
+QUESTION_DETAILS_QUERY = """
+  query questionDetails($titleSlug: String!) {
+    question(titleSlug: $titleSlug) {
+      questionFrontendId
+      titleSlug
+      difficulty
+      topicTags {
+        name
+        slug
+      }
+      stats
+    }
+  }
+"""
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+class TokenBucket:
+    """Allows rate requests per second on average, with bursts of up to capacity"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class ResponseCache:
+    """One JSON file per slug; entries older than ttl seconds are treated as missing and removed"""
+
+    def __init__(self, directory=CACHE_DIR, ttl=DEFAULT_TTL):
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, slug):
+        return os.path.join(self.directory, f"{slug}.json")
+
+    def get(self, slug):
+        """Cached details for slug, or None if missing or expired"""
+        try:
+            with open(self.path(slug), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry["fetched_at"] > self.ttl:
+            self.discard(slug)
+            return None
+
+        return entry["data"]
+
+    def put(self, slug, data):
+        """Store details for slug"""
+        tmp_path = f"{self.path(slug)}.{os.getpid()}.tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time(), "data": data}, f)
+
+        os.replace(tmp_path, self.path(slug))
+
+    def discard(self, slug):
+        try:
+            os.remove(self.path(slug))
+        except FileNotFoundError:
+            pass
+
+    def evict_expired(self):
+        """Remove every expired or unreadable entry, including slugs no longer in any catalogue; returns the number removed"""
+        removed = 0
+
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    fresh = time.time() - json.load(f)["fetched_at"] <= self.ttl
+            except (OSError, ValueError, KeyError, TypeError):
+                fresh = False
+
+            if not fresh:
+                try:
+                    os.remove(path)
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+
+        return removed
+
+class FetchError(Exception):
+    """Raised when a question could not be fetched; retryable errors have retryable set"""
+
+    def __init__(self, message, retryable=False, retry_after=None, missing=False):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+        self.missing = missing
+
+def post_graphql(endpoint, slug, timeout):
+    """Blocking GraphQL request for one slug; run in a worker thread"""
+    body = json.dumps({
+        "query": QUESTION_DETAILS_QUERY,
+        "variables": {"titleSlug": slug},
+        "operationName": "questionDetails",
+    }).encode("utf-8")
+    request = urllib.request.Request(endpoint, data=body, headers={"Content-Type": "application/json"})
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            payload = json.load(response)
+    except urllib.error.HTTPError as e:
+        retry_after = e.headers.get("Retry-After") if e.headers else None
+        raise FetchError(
+            f"HTTP {e.code}",
+            retryable=e.code in RETRYABLE_STATUS,
+            retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+        )
+    except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+        raise FetchError(f"Network error: {e}", retryable=True)
+    except ValueError as e:
+        # e.g. an HTML challenge page served with 200
+        raise FetchError(f"Invalid JSON response: {e}", retryable=True)
+
+    if not isinstance(payload, dict):
+        raise FetchError("Invalid JSON response: expected an object", retryable=True)
+
+    if payload.get("errors"):
+        raise FetchError(f"GraphQL error: {payload['errors'][0].get('message', 'unknown')}")
+
+    question = (payload.get("data") or {}).get("question")
+    if question is None:
+        raise FetchError("Question not found", missing=True)
+
+    return question
+
+async def fetch_details(slug, endpoint, bucket, retries, backoff, timeout):
+    """Fetch one slug, retrying retryable failures with exponential backoff and jitter"""
+    for attempt in range(retries + 1):
+        await bucket.acquire()
+
+        try:
+            return await asyncio.to_thread(post_graphql, endpoint, slug, timeout)
+        except FetchError as e:
+            if not e.retryable or attempt == retries:
+                raise
+            delay = e.retry_after if e.retry_after is not None else backoff * 2 ** attempt
+            await asyncio.sleep(delay + random.uniform(0, backoff))
+
+async def enrich_details(slugs, endpoint=LEETCODE_ENDPOINT, cache=None, concurrency=4, rate=2.0,
+                         retries=3, backoff=0.5, timeout=10.0):
+    """Return ({slug: details}, {slug: error}) for slugs, serving what it can from cache"""
+    cache = cache or ResponseCache()
+    cache.evict_expired()
+    bucket = TokenBucket(rate)
+    semaphore = asyncio.Semaphore(concurrency)
+    details = {}
+    failures = {}
+
+    async def enrich_one(slug):
+        cached = cache.get(slug)
+        if cached is not None:
+            details[slug] = cached
+            return
+
+        async with semaphore:
+            try:
+                data = await fetch_details(slug, endpoint, bucket, retries, backoff, timeout)
+            except FetchError as e:
+                failures[slug] = str(e)
+                # Remember slugs LeetCode doesn't know so reruns don't ask again
+                if e.missing:
+                    cache.put(slug, {})
+                return
+
+        cache.put(slug, data)
+        details[slug] = data
+
+    await asyncio.gather(*(enrich_one(slug) for slug in slugs))
+
+    return details, failures
+
+def apply_details(catalogue, details):
+    """New catalogue with topic tags and difficulty taken from fetched details where available"""
+    enriched = Catalogue({}, {})
+
+    for q in catalogue:
+        data = details.get(q.slug)
+        tags = q.tags
+        difficulty = q.difficulty
+
+        if data:
+            # Anything the schema would reject falls back to the catalogue's own values
+            fetched_tags = [tag.get("name") for tag in data.get("topicTags") or [] if isinstance(tag, dict)]
+            tags = [tag for tag in fetched_tags if isinstance(tag, str) and 0 < len(tag) <= MAX_TAG_LENGTH] or q.tags
+            if data.get("difficulty") in VALID_DIFFICULTIES:
+                difficulty = data["difficulty"]
+
+        enriched.add(Question(q.leetcode_id, q.title, difficulty, q.description, q.category, tags))
+
+    return enriched
+
+def enrich_catalogue(catalogue, **options):
+    """Fetch details for every question and return (enriched catalogue, failures)"""
+    details, failures = asyncio.run(enrich_details([q.slug for q in catalogue], **options))
+    return apply_details(catalogue, details), failures
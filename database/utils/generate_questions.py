@@ -3,236 +3,215 @@
 Generate SQL script for all 150 LeetCode questions
 """
 
-questions_data = {
-    "Array / String": [
-        (88, "Merge Sorted Array", "Easy", "You are given two integer arrays nums1 and nums2, sorted in non-decreasing order, and two integers m and n, representing the number of elements in nums1 and nums2 respectively."),
-        (27, "Remove Element", "Easy", "Given an integer array nums and an integer val, remove all occurrences of val in nums in-place."),
-        (26, "Remove Duplicates from Sorted Array", "Easy", "Given an integer array nums sorted in non-decreasing order, remove the duplicates in-place such that each unique element appears only once."),
-        (80, "Remove Duplicates from Sorted Array II", "Medium", "Given an integer array nums sorted in non-decreasing order, remove some duplicates in-place such that each unique element appears at most twice."),
-        (169, "Majority Element", "Easy", "Given an array nums of size n, return the majority element."),
-        (189, "Rotate Array", "Medium", "Given an array, rotate the array to the right by k steps, where k is non-negative."),
-        (121, "Best Time to Buy and Sell Stock", "Easy", "You are given an array prices where prices[i] is the price of a given stock on the ith day."),
-        (122, "Best Time to Buy and Sell Stock II", "Medium", "You are given an integer array prices where prices[i] is the price of a given stock on the ith day."),
-        (55, "Jump Game", "Medium", "You are given an integer array nums. You are initially positioned at the array's first index."),
-        (45, "Jump Game II", "Medium", "Given an array of non-negative integers nums, you are initially positioned at the first index of the array."),
-        (274, "H-Index", "Medium", "Given an array of integers citations where citations[i] is the number of citations a researcher received for their ith paper."),
-        (380, "Insert Delete GetRandom O(1)", "Medium", "Implement the RandomizedSet class with insert, remove, and getRandom operations in average O(1) time."),
-        (238, "Product of Array Except Self", "Medium", "Given an integer array nums, return an array answer such that answer[i] is equal to the product of all the elements of nums except nums[i]."),
-        (134, "Gas Station", "Medium", "There are n gas stations along a circular route, where the amount of gas at the ith station is gas[i]."),
-        (135, "Candy", "Hard", "There are n children standing in a line. Each child is assigned a rating value given in the integer array ratings."),
-        (42, "Trapping Rain Water", "Hard", "Given n non-negative integers representing an elevation map where the width of each bar is 1, compute how much water it can trap after raining."),
-        (13, "Roman to Integer", "Easy", "Roman numerals are represented by seven different symbols: I, V, X, L, C, D and M."),
-        (12, "Integer to Roman", "Medium", "Roman numerals are represented by seven different symbols: I, V, X, L, C, D and M."),
-        (58, "Length of Last Word", "Easy", "Given a string s consisting of words and spaces, return the length of the last word in the string."),
-        (14, "Longest Common Prefix", "Easy", "Write a function to find the longest common prefix string amongst an array of strings."),
-        (151, "Reverse Words in a String", "Medium", "Given an input string s, reverse the order of the words."),
-        (6, "Zigzag Conversion", "Medium", "The string \"PAYPALISHIRING\" is written in a zigzag pattern on a given number of rows."),
-        (28, "Find the Index of the First Occurrence in a String", "Medium", "Given two strings needle and haystack, return the index of the first occurrence of needle in haystack."),
-        (68, "Text Justification", "Hard", "Given an array of strings words and a width maxWidth, format the text such that each line has exactly maxWidth characters.")
-    ],
-
-    "Two Pointers": [
-        (125, "Valid Palindrome", "Easy", "A phrase is a palindrome if, after converting all uppercase letters into lowercase letters and removing all non-alphanumeric characters, it reads the same forward and backward."),
-        (392, "Is Subsequence", "Easy", "Given two strings s and t, return true if s is a subsequence of t, or false otherwise."),
-        (167, "Two Sum II - Input Array Is Sorted", "Medium", "Given a 1-indexed array of integers numbers that is already sorted in non-decreasing order, find two numbers such that they add up to a specific target number."),
-        (11, "Container With Most Water", "Medium", "You are given an integer array height of length n. There are n vertical lines drawn such that the two endpoints of the ith line are (i, 0) and (i, height[i])."),
-        (15, "3Sum", "Medium", "Given an integer array nums, return all the triplets [nums[i], nums[j], nums[k]] such that i != j, i != k, and j != k, and nums[i] + nums[j] + nums[k] == 0.")
-    ],
-
-    "Sliding Window": [
-        (209, "Minimum Size Subarray Sum", "Medium", "Given an array of positive integers nums and a positive integer target, return the minimal length of a contiguous subarray."),
-        (3, "Longest Substring Without Repeating Characters", "Medium", "Given a string s, find the length of the longest substring without repeating characters."),
-        (30, "Substring with Concatenation of All Words", "Hard", "You are given a string s and an array of strings words of the same length."),
-        (76, "Minimum Window Substring", "Hard", "Given two strings s and t of lengths m and n respectively, return the minimum window substring of s.")
-    ],
-
-    "Matrix": [
-        (36, "Valid Sudoku", "Medium", "Determine if a 9 x 9 Sudoku board is valid. Only the filled cells need to be validated."),
-        (54, "Spiral Matrix", "Medium", "Given an m x n matrix, return all elements of the matrix in spiral order."),
-        (48, "Rotate Image", "Medium", "You are given an n x n 2D matrix representing an image, rotate the image by 90 degrees (clockwise)."),
-        (73, "Set Matrix Zeroes", "Medium", "Given an m x n integer matrix matrix, if an element is 0, set its entire row and column to 0s."),
-        (289, "Game of Life", "Medium", "According to Wikipedia's article: \"The Game of Life, also known simply as Life, is a cellular automaton devised by the British mathematician John Horton Conway in 1970.\"")
-    ],
-
-    "Hashmap": [
-        (383, "Ransom Note", "Easy", "Given two strings ransomNote and magazine, return true if ransomNote can be constructed by using the letters from magazine."),
-        (205, "Isomorphic Strings", "Easy", "Given two strings s and t, determine if they are isomorphic."),
-        (290, "Word Pattern", "Easy", "Given a pattern and a string s, find if s follows the same pattern."),
-        (242, "Valid Anagram", "Easy", "Given two strings s and t, return true if t is an anagram of s, and false otherwise."),
-        (49, "Group Anagrams", "Medium", "Given an array of strings strs, group the anagrams together."),
-        (1, "Two Sum", "Easy", "Given an array of integers nums and an integer target, return indices of the two numbers such that they add up to target."),
-        (202, "Happy Number", "Easy", "Write an algorithm to determine if a number n is happy."),
-        (219, "Contains Duplicate II", "Easy", "Given an integer array nums and an integer k, return true if there are two distinct indices i and j in the array such that nums[i] == nums[j] and abs(i - j) <= k."),
-        (128, "Longest Consecutive Sequence", "Hard", "Given an unsorted array of integers nums, return the length of the longest consecutive elements sequence.")
-    ],
-
-    "Intervals": [
-        (228, "Summary Ranges", "Easy", "You are given a sorted unique integer array nums."),
-        (56, "Merge Intervals", "Medium", "Given an array of intervals where intervals[i] = [starti, endi], merge all overlapping intervals."),
-        (57, "Insert Interval", "Medium", "You are given an array of non-overlapping intervals intervals where intervals[i] = [starti, endi]."),
-        (452, "Minimum Number of Arrows to Burst Balloons", "Medium", "There are some spherical balloons taped onto a flat wall that represents the XY-plane.")
-    ],
-
-    "Stack": [
-        (20, "Valid Parentheses", "Easy", "Given a string s containing just the characters '(', ')', '{', '}', '[' and ']', determine if the input string is valid."),
-        (71, "Simplify Path", "Medium", "Given a string path, which is an absolute path (starting with a slash '/') to a file or directory in a Unix-style file system."),
-        (155, "Min Stack", "Medium", "Design a stack that supports push, pop, top, and retrieving the minimum element in constant time."),
-        (150, "Evaluate Reverse Polish Notation", "Medium", "Evaluate the value of an arithmetic expression in Reverse Polish Notation."),
-        (224, "Basic Calculator", "Hard", "Given a string s representing a valid expression, implement a basic calculator to evaluate it.")
-    ],
-
-    "Linked List": [
-        (141, "Linked List Cycle", "Easy", "Given head, the head of a linked list, determine if the linked list has a cycle in it."),
-        (2, "Add Two Numbers", "Medium", "You are given two non-empty linked lists representing two non-negative integers."),
-        (21, "Merge Two Sorted Lists", "Easy", "You are given the heads of two sorted linked lists list1 and list2."),
-        (138, "Copy List with Random Pointer", "Medium", "A linked list of length n is given such that each node contains an additional random pointer."),
-        (92, "Reverse Linked List II", "Medium", "Given the head of a singly linked list and two integers left and right where left <= right."),
-        (25, "Reverse Nodes in k-Group", "Hard", "Given the head of a linked list, reverse the nodes of the list k at a time."),
-        (19, "Remove Nth Node From End of List", "Medium", "Given the head of a linked list, remove the nth node from the end of the list."),
-        (82, "Remove Duplicates from Sorted List II", "Medium", "Given the head of a sorted linked list, delete all nodes that have duplicate numbers."),
-        (61, "Rotate List", "Medium", "Given the head of a linked list, rotate the list to the right by k places."),
-        (86, "Partition List", "Medium", "Given the head of a linked list and a value x, partition it such that all nodes less than x come before nodes greater than or equal to x."),
-        (146, "LRU Cache", "Medium", "Design a data structure that follows the constraints of a Least Recently Used (LRU) cache.")
-    ],
-
-    "Binary Tree General": [
-        (104, "Maximum Depth of Binary Tree", "Easy", "Given the root of a binary tree, return its maximum depth."),
-        (100, "Same Tree", "Easy", "Given the roots of two binary trees p and q, write a function to check if they are the same or not."),
-        (226, "Invert Binary Tree", "Easy", "Given the root of a binary tree, invert the tree, and return its root."),
-        (101, "Symmetric Tree", "Easy", "Given the root of a binary tree, check whether it is a mirror of itself."),
-        (105, "Construct Binary Tree from Preorder and Inorder Traversal", "Medium", "Given two integer arrays preorder and inorder where preorder is the preorder traversal of a binary tree and inorder is the inorder traversal of the same tree."),
-        (106, "Construct Binary Tree from Inorder and Postorder Traversal", "Medium", "Given two integer arrays inorder and postorder where inorder is the inorder traversal of a binary tree and postorder is the postorder traversal of the same tree."),
-        (117, "Populating Next Right Pointers in Each Node II", "Medium", "Given a binary tree, populate each next pointer to point to its next right node."),
-        (114, "Flatten Binary Tree to Linked List", "Medium", "Given the root of a binary tree, flatten the tree into a \"linked list\"."),
-        (112, "Path Sum", "Easy", "Given the root of a binary tree and an integer targetSum, return true if the tree has a root-to-leaf path such that adding up all the values along the path equals targetSum."),
-        (129, "Sum Root to Leaf Numbers", "Medium", "You are given the root of a binary tree containing digits from 0 to 9 only."),
-        (124, "Binary Tree Maximum Path Sum", "Hard", "A path in a binary tree is a sequence of nodes where each pair of adjacent nodes in the sequence has an edge connecting them."),
-        (173, "Binary Search Tree Iterator", "Medium", "Implement the BSTIterator class that represents an iterator over the in-order traversal of a binary search tree (BST)."),
-        (222, "Count Complete Tree Nodes", "Medium", "Given the root of a complete binary tree, return the number of the nodes in the tree."),
-        (236, "Lowest Common Ancestor of a Binary Tree", "Medium", "Given a binary tree, find the lowest common ancestor (LCA) of two given nodes in the tree.")
-    ],
-
-    "Binary Tree BFS": [
-        (199, "Binary Tree Right Side View", "Medium", "Given the root of a binary tree, imagine yourself standing on the right side of it."),
-        (637, "Average of Levels in Binary Tree", "Easy", "Given the root of a binary tree, return the average value of the nodes on each level in the form of an array."),
-        (102, "Binary Tree Level Order Traversal", "Medium", "Given the root of a binary tree, return the level order traversal of its nodes' values."),
-        (103, "Binary Tree Zigzag Level Order Traversal", "Medium", "Given the root of a binary tree, return the zigzag level order traversal of its nodes' values."),
-        (530, "Minimum Absolute Difference in BST", "Easy", "Given the root of a Binary Search Tree (BST), return the minimum absolute difference between the values of any two different nodes in the tree."),
-        (230, "Kth Smallest Element in a BST", "Medium", "Given the root of a binary search tree, and an integer k, return the kth smallest value (1-indexed) of all the values of the nodes in the tree."),
-        (98, "Validate Binary Search Tree", "Medium", "Given the root of a binary tree, determine if it is a valid binary search tree (BST).")
-    ],
-
-    "Graph General": [
-        (200, "Number of Islands", "Medium", "Given an m x n 2D binary grid grid which represents a map of '1's (land) and '0's (water), return the number of islands."),
-        (130, "Surrounded Regions", "Medium", "Given an m x n matrix board containing 'X' and 'O', capture all regions that are 4-directionally surrounded by 'X'."),
-        (133, "Clone Graph", "Medium", "Given a reference of a node in a connected undirected graph."),
-        (399, "Evaluate Division", "Medium", "You are given an array of variable pairs equations and an array of real numbers values."),
-        (207, "Course Schedule", "Medium", "There are a total of numCourses courses you have to take, labeled from 0 to numCourses - 1."),
-        (210, "Course Schedule II", "Medium", "There are a total of numCourses courses you have to take, labeled from 0 to numCourses - 1.")
-    ],
-
-    "Graph BFS": [
-        (909, "Snakes and Ladders", "Medium", "You are given an n x n integer matrix board where the cells are labeled from 1 to n2 in a Boustrophedon style."),
-        (433, "Minimum Genetic Mutation", "Medium", "A gene string can be represented by an 8-character long string, with choices from 'A', 'C', 'G', and 'T'.")
-    ],
-
-    "Trie": [
-        (208, "Implement Trie (Prefix Tree)", "Medium", "A trie (pronounced as \"try\") or prefix tree is a tree data structure used to efficiently store and retrieve keys in a dataset of strings."),
-        (211, "Design Add and Search Words Data Structure", "Medium", "Design a data structure that supports adding new words and finding if a string matches any previously added string."),
-        (212, "Word Search II", "Hard", "Given an m x n board of characters and a list of strings words, return all words on the board.")
-    ],
-
-    "Backtracking": [
-        (17, "Letter Combinations of a Phone Number", "Medium", "Given a string containing digits from 2-9 inclusive, return all possible letter combinations that the number could represent."),
-        (77, "Combinations", "Medium", "Given two integers n and k, return all possible combinations of k numbers chosen from the range [1, n]."),
-        (46, "Permutations", "Medium", "Given an array nums of distinct integers, return all the possible permutations."),
-        (39, "Combination Sum", "Medium", "Given an array of distinct integers candidates and a target integer target, return a list of all unique combinations of candidates where the chosen numbers sum to target."),
-        (52, "N-Queens II", "Hard", "The n-queens puzzle is the problem of placing n queens on an n x n chessboard such that no two queens attack each other."),
-        (22, "Generate Parentheses", "Medium", "Given n pairs of parentheses, write a function to generate all combinations of well-formed parentheses."),
-        (79, "Word Search", "Medium", "Given an m x n grid of characters board and a string word, return true if word exists in the grid.")
-    ],
-
-    "Divide & Conquer": [
-        (108, "Convert Sorted Array to Binary Search Tree", "Easy", "Given an integer array nums where the elements are sorted in ascending order, convert it to a height-balanced binary search tree."),
-        (148, "Sort List", "Medium", "Given the head of a linked list, return the list after sorting it in ascending order."),
-        (427, "Construct Quad Tree", "Medium", "Given a n * n matrix grid of 0's and 1's only, we want to represent the grid with a Quad Tree."),
-        (23, "Merge k Sorted Lists", "Hard", "You are given an array of k linked-lists lists, each linked-list is sorted in ascending order.")
-    ],
-
-    "Kadane's Algorithm": [
-        (53, "Maximum Subarray", "Medium", "Given an integer array nums, find the contiguous subarray (containing at least one number) which has the largest sum and return its sum."),
-        (918, "Maximum Sum Circular Subarray", "Medium", "Given a circular integer array nums of length n, return the maximum possible sum of a non-empty subarray of nums.")
-    ],
-
-    "Binary Search": [
-        (35, "Search Insert Position", "Easy", "Given a sorted array of distinct integers and a target value, return the index if the target is found."),
-        (74, "Search a 2D Matrix", "Medium", "Write an efficient algorithm that searches for a value target in an m x n integer matrix matrix."),
-        (162, "Find Peak Element", "Medium", "A peak element is an element that is strictly greater than its neighbors."),
-        (33, "Search in Rotated Sorted Array", "Medium", "There is an integer array nums sorted in ascending order (with distinct values)."),
-        (34, "Find First and Last Position of Element in Sorted Array", "Medium", "Given an array of integers nums sorted in non-decreasing order, find the starting and ending position of a given target value."),
-        (153, "Find Minimum in Rotated Sorted Array", "Medium", "Suppose an array of length n sorted in ascending order is rotated between 1 and n times."),
-        (4, "Median of Two Sorted Arrays", "Hard", "Given two sorted arrays nums1 and nums2 of size m and n respectively, return the median of the two sorted arrays.")
-    ],
-
-    "Heap": [
-        (215, "Kth Largest Element in an Array", "Medium", "Given an integer array nums and an integer k, return the kth largest element in the array."),
-        (502, "IPO", "Hard", "Suppose LeetCode will start its IPO soon. In order to sell a good price of its shares to Venture Capital, LeetCode would like to work on some projects to increase its capital before the IPO."),
-        (373, "Find K Pairs with Smallest Sums", "Medium", "You are given two integer arrays nums1 and nums2 sorted in ascending order and an integer k."),
-        (295, "Find Median from Data Stream", "Hard", "The median is the middle value in an ordered integer list. If the size of the list is even, there is no middle value and the median is the mean of the two middle values.")
-    ],
-
-    "Bit Manipulation": [
-        (67, "Add Binary", "Easy", "Given two binary strings a and b, return their sum as a binary string."),
-        (190, "Reverse Bits", "Easy", "Reverse bits of a given 32 bits unsigned integer."),
-        (191, "Number of 1 Bits", "Easy", "Write a function that takes an unsigned integer and returns the number of '1' bits it has (also known as the Hamming weight)."),
-        (136, "Single Number", "Easy", "Given a non-empty array of integers nums, every element appears twice except for one. Find that single one."),
-        (137, "Single Number II", "Medium", "Given an integer array nums where every element appears three times except for one, which appears exactly once. Find the single element and return it."),
-        (201, "Bitwise AND of Numbers Range", "Medium", "Given two integers left and right that represent the range [left, right], return the bitwise AND of all numbers in this range, inclusive.")
-    ],
-
-    "Math": [
-        (9, "Palindrome Number", "Easy", "Given an integer x, return true if x is palindrome integer."),
-        (66, "Plus One", "Easy", "You are given a large integer represented as an integer array digits, where each digits[i] is the ith digit of the integer."),
-        (172, "Factorial Trailing Zeroes", "Medium", "Given an integer n, return the number of trailing zeroes in n!."),
-        (69, "Sqrt(x)", "Easy", "Given a non-negative integer x, compute and return the square root of x."),
-        (50, "Pow(x, n)", "Medium", "Implement pow(x, n), which calculates x raised to the power n (i.e., xn)."),
-        (149, "Max Points on a Line", "Hard", "Given an array of points where points[i] = [xi, yi] represents a point on the X-Y plane, return the maximum number of points that lie on the same straight line.")
-    ],
-
-    "1D Dynamic Programming": [
-        (70, "Climbing Stairs", "Easy", "You are climbing a staircase. It takes n steps to reach the top."),
-        (198, "House Robber", "Medium", "You are a professional robber planning to rob houses along a street."),
-        (139, "Word Break", "Medium", "Given a string s and a dictionary of strings wordDict, return true if s can be segmented into a space-separated sequence of one or more dictionary words."),
-        (322, "Coin Change", "Medium", "You are given an integer array coins representing coins of different denominations and an integer amount representing a total amount of money."),
-        (300, "Longest Increasing Subsequence", "Medium", "Given an integer array nums, return the length of the longest strictly increasing subsequence.")
-    ],
-
-    "Multidimensional DP": [
-        (120, "Triangle", "Medium", "Given a triangle array, return the minimum path sum from top to bottom."),
-        (64, "Minimum Path Sum", "Medium", "Given a m x n grid filled with non-negative numbers, find a path from top left to bottom right, which minimizes the sum of all numbers along its path."),
-        (63, "Unique Paths II", "Medium", "You are given an m x n integer array grid. There is a robot initially located at the top-left corner (i.e., grid[0][0])."),
-        (5, "Longest Palindromic Substring", "Medium", "Given a string s, return the longest palindromic substring in s."),
-        (97, "Interleaving String", "Medium", "Given strings s1, s2, and s3, find whether s3 is formed by an interleaving of s1 and s2."),
-        (72, "Edit Distance", "Hard", "Given two strings word1 and word2, return the minimum number of operations required to convert word1 to word2."),
-        (123, "Best Time to Buy and Sell Stock III", "Hard", "You are given an array prices where prices[i] is the price of a given stock on the ith day."),
-        (188, "Best Time to Buy and Sell Stock IV", "Hard", "You are given an integer array prices where prices[i] is the price of a given stock on the ith day, and an integer k."),
-        (221, "Maximal Square", "Medium", "Given an m x n binary matrix filled with 0's and 1's, find the largest square containing only 1's and return its area."),
-        (115, "Distinct Subsequences", "Hard", "Given two strings s and t, return the number of distinct subsequences of s which equals t.")
-    ]
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import marshal
+import os
+import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from catalogue import Catalogue, CatalogueError, escape_copy_value, escape_sql_string
+from db_loader import load_partitions
+from enrich import CACHE_DIR as ENRICH_CACHE_DIR, DEFAULT_TTL as ENRICH_TTL, LEETCODE_ENDPOINT, ResponseCache, enrich_catalogue
+from seed_profile import SeedProfile
+from snapshot import write_ndjson, write_snapshot
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Bundled Top Interview 150 list; more catalogues can be merged in with --catalogue
+BUNDLED_CATALOGUE = os.path.join(UTILS_DIR, "catalogues", "top_interview_150.jsonl")
+
+# Compiled (marshal) copies of parsed catalogues, keyed by source path
+CACHE_DIR = os.path.join(UTILS_DIR, ".catalogue_cache")
+CACHE_VERSION = 1
+
+# Learning path seeds; they reference questions by slug so they load after the question shards
+PATH_SEED_FILES = [
+    os.path.join(UTILS_DIR, "..", "seed", "create-top-interview-150-path.sql"),
+    os.path.join(UTILS_DIR, "..", "seed", "create-graph-theory-path.sql"),
+]
+
+def catalogue_record(record):
+    """(category, leetcode_id, title, difficulty, description) from one parsed record; description may be missing or null"""
+    for field in ("category", "title"):
+        if not isinstance(record[field], str):
+            raise ValueError(f"{field} must be a string, not {type(record[field]).__name__}")
+
+    return record["category"], int(record["leetcode_id"]), record["title"], record["difficulty"], record.get("description") or ""
+
+def checked_record(record, location):
+    """catalogue_record, reporting bad rows as CatalogueError with their location"""
+    try:
+        return catalogue_record(record)
+    except KeyError as e:
+        raise CatalogueError(f"{location}: missing field {e.args[0]!r}")
+    except (ValueError, TypeError, AttributeError) as e:
+        raise CatalogueError(f"{location}: {e}")
+
+def iter_catalogue_records(path):
+    """Yield (category, leetcode_id, title, difficulty, description) from a JSON, JSONL or CSV catalogue"""
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == ".jsonl":
+        with open(path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        record = json.loads(line)
+                    except ValueError as e:
+                        raise CatalogueError(f"{path}:{line_number}: {e}")
+                    yield checked_record(record, f"{path}:{line_number}")
+    elif ext == ".csv":
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            for record in reader:
+                yield checked_record(record, f"{path}:{reader.line_num}")
+    elif ext == ".json":
+        # Either a list of records or {category: [records]}; JSON has to be read whole
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except ValueError as e:
+                raise CatalogueError(f"{path}: {e}")
+
+        if isinstance(data, dict):
+            try:
+                data = [dict(record, category=category) for category, records in data.items() for record in records]
+            except (TypeError, ValueError):
+                raise CatalogueError(f"{path}: expected {{category: [records]}} or a list of records")
+
+        for index, record in enumerate(data, 1):
+            yield checked_record(record, f"{path}: record {index}")
+    else:
+        raise CatalogueError(f"Unsupported catalogue format: {path}")
+
+def parse_catalogue(path):
+    """Parse one catalogue into {category: [(leetcode_id, title, difficulty, description)]}"""
+    data = {}
+
+    for category, leetcode_id, title, difficulty, description in iter_catalogue_records(path):
+        data.setdefault(category, []).append((leetcode_id, title, difficulty, description))
+
+    return data
+
+def file_sha256(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+def load_catalogue(path, use_cache=True):
+    """Parse a catalogue, reusing the compiled cache while the source is unchanged"""
+    if not use_cache:
+        return parse_catalogue(path)
+
+    stat = os.stat(path)
+    source_hash = None
+    cache_path = os.path.join(CACHE_DIR, hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest() + ".bin")
+
+    try:
+        with open(cache_path, "rb") as f:
+            version, mtime_ns, size, cached_hash, data = marshal.load(f)
+
+        if version == CACHE_VERSION:
+            if (mtime_ns, size) == (stat.st_mtime_ns, stat.st_size):
+                return data
+
+            # Touched but possibly identical (e.g. fresh checkout); fall back to the content hash
+            source_hash = file_sha256(path)
+            if source_hash == cached_hash:
+                save_catalogue_cache(cache_path, stat, source_hash, data)
+                return data
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    data = parse_catalogue(path)
+    save_catalogue_cache(cache_path, stat, source_hash or file_sha256(path), data)
+
+    return data
+
+def save_catalogue_cache(cache_path, stat, source_hash, data):
+    """Atomically write a compiled catalogue cache entry; the cache is best effort (e.g. read-only checkouts)"""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            marshal.dump((CACHE_VERSION, stat.st_mtime_ns, stat.st_size, source_hash, data), f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def load_catalogues(paths, use_cache=True):
+    """Merge catalogues in order; a question already seen (by leetcode_id) is skipped"""
+    merged = {}
+    seen = set()
+
+    for path in paths:
+        for category, questions in load_catalogue(path, use_cache).items():
+            for question in questions:
+                if question[0] in seen:
+                    continue
+                seen.add(question[0])
+                merged.setdefault(category, []).append(question)
+
+    return merged
+
+category_tags_map = {
+    "Array / String": ["Array", "String"],
+    "Two Pointers": ["Two Pointers"],
+    "Sliding Window": ["Sliding Window"],
+    "Matrix": ["Matrix"],
+    "Hashmap": ["Hash Table"],
+    "Intervals": ["Intervals"],
+    "Stack": ["Stack"],
+    "Linked List": ["Linked List"],
+    "Binary Tree General": ["Tree", "Binary Tree"],
+    "Binary Tree BFS": ["Tree", "Binary Tree", "BFS"],
+    "Graph General": ["Graph"],
+    "Graph BFS": ["Graph", "BFS"],
+    "Trie": ["Trie"],
+    "Backtracking": ["Backtracking"],
+    "Divide & Conquer": ["Divide and Conquer"],
+    "Kadane's Algorithm": ["Dynamic Programming", "Array"],
+    "Binary Search": ["Binary Search"],
+    "Heap": ["Heap"],
+    "Bit Manipulation": ["Bit Manipulation"],
+    "Math": ["Math"],
+    "1D Dynamic Programming": ["Dynamic Programming"],
+    "Multidimensional DP": ["Dynamic Programming"]
 }
 
-def create_slug(title):
-    """Convert title to URL slug"""
-    return title.lower().replace(" ", "-").replace("(", "").replace(")", "").replace(",", "").replace("'", "").replace(".", "").replace("/", "-")
+WRITE_BUFFER_SIZE = 1 << 16
 
-def escape_sql_string(s):
-    """Escape single quotes in SQL strings"""
-    return s.replace("'", "''")
+# Rows per multi-row INSERT; keeps statements well under typical parser/packet limits
+DEFAULT_BATCH_SIZE = 500
 
-def generate_sql():
-    """Generate complete SQL script"""
+MANIFEST_VERSION = 2
 
-    sql_content = """-- LeetCode 150 Questions - Complete Dataset
+SHARD_MANIFEST = "manifest.json"
+STATS_FILE = "question_stats.sql"
+
+def build_catalogue(questions_data):
+    """Index and validate the loaded questions"""
+    return Catalogue(questions_data, category_tags_map)
+
+def generate_sql(catalogue):
+    """Generate complete SQL script, yielding it chunk by chunk"""
+
+    yield """-- LeetCode 150 Questions - Complete Dataset
 -- Generated script with all questions organized by category
 
 -- Clear existing data
@@ -242,67 +221,526 @@ DELETE FROM questions;
 """
 
     # Generate questions
-    for category, questions in questions_data.items():
-        sql_content += f"-- {category} ({len(questions)} questions)\n"
-
-        for leetcode_id, title, difficulty, description in questions:
-            slug = create_slug(title)
-            url = f"https://leetcode.com/problems/{slug}/"
+    for category, questions in catalogue.by_category.items():
+        yield f"-- {category} ({len(questions)} questions)\n"
 
-            sql_content += f"""INSERT INTO questions (leetcode_id, title, slug, difficulty, description, url, is_custom) VALUES
-('{leetcode_id}', '{escape_sql_string(title)}', '{slug}', '{difficulty}', '{escape_sql_string(description)}', '{url}', FALSE);
+        for q in questions:
+            yield f"""INSERT INTO questions (leetcode_id, title, slug, difficulty, description, url, is_custom) VALUES
+('{q.leetcode_id}', '{q.title_sql}', '{q.slug}', '{q.difficulty}', '{q.description_sql}', '{q.url}', FALSE);
 """
 
-        sql_content += "\n"
+        yield "\n"
 
     # Generate tags
-    sql_content += "-- Insert tags for questions\n"
-
-    category_tags_map = {
-        "Array / String": ["Array", "String"],
-        "Two Pointers": ["Two Pointers"],
-        "Sliding Window": ["Sliding Window"],
-        "Matrix": ["Matrix"],
-        "Hashmap": ["Hash Table"],
-        "Intervals": ["Intervals"],
-        "Stack": ["Stack"],
-        "Linked List": ["Linked List"],
-        "Binary Tree General": ["Tree", "Binary Tree"],
-        "Binary Tree BFS": ["Tree", "Binary Tree", "BFS"],
-        "Graph General": ["Graph"],
-        "Graph BFS": ["Graph", "BFS"],
-        "Trie": ["Trie"],
-        "Backtracking": ["Backtracking"],
-        "Divide & Conquer": ["Divide and Conquer"],
-        "Kadane's Algorithm": ["Dynamic Programming", "Array"],
-        "Binary Search": ["Binary Search"],
-        "Heap": ["Heap"],
-        "Bit Manipulation": ["Bit Manipulation"],
-        "Math": ["Math"],
-        "1D Dynamic Programming": ["Dynamic Programming"],
-        "Multidimensional DP": ["Dynamic Programming"]
+    yield "-- Insert tags for questions\n"
+
+    for category, questions in catalogue.by_category.items():
+        for q in questions:
+            for tag in q.tags_sql:
+                yield f"""INSERT INTO question_tags (question_id, tag)
+SELECT q.id, '{tag}' FROM questions q WHERE q.slug = '{q.slug}';
+"""
+
+        yield "\n"
+
+    yield question_stats_sql(catalogue)
+
+def generate_copy(catalogue):
+    """Generate SQL script using COPY ... FROM STDIN blocks, yielding it chunk by chunk"""
+
+    yield """-- LeetCode 150 Questions - Complete Dataset (COPY format)
+-- Question ids are derived from slugs, so tag rows reference them directly
+
+-- Clear existing data
+DELETE FROM question_tags;
+DELETE FROM questions;
+
+COPY questions (id, leetcode_id, title, slug, difficulty, description, url, is_custom) FROM STDIN;
+"""
+
+    for q in catalogue:
+        yield "\t".join([
+            q.uuid,
+            str(q.leetcode_id),
+            escape_copy_value(q.title),
+            q.slug,
+            q.difficulty,
+            escape_copy_value(q.description),
+            q.url,
+            "f",
+        ]) + "\n"
+
+    yield "\\.\n\n"
+    yield "COPY question_tags (question_id, tag) FROM STDIN;\n"
+
+    for q in catalogue:
+        for tag in q.tags:
+            yield f"{q.uuid}\t{escape_copy_value(tag)}\n"
+
+    yield "\\.\n\n"
+    yield question_stats_sql(catalogue)
+
+def question_hash(leetcode_id, title, slug, difficulty, description, tags):
+    """Content hash of everything the seed writes for one question"""
+    payload = json.dumps([leetcode_id, title, slug, difficulty, description, sorted(tags)], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def build_manifest(catalogue):
+    """Map leetcode_id -> {slug, hash, tags} for the current catalogue"""
+    return {
+        str(q.leetcode_id): {
+            "slug": q.slug,
+            "hash": question_hash(q.leetcode_id, q.title, q.slug, q.difficulty, q.description, q.tags),
+            "tags": sorted(q.tags),
+        }
+        for q in catalogue
     }
 
-    for category, questions in questions_data.items():
-        tags = category_tags_map.get(category, [category])
+def load_manifest(path):
+    """Load a previously saved manifest, or an empty one if there is none"""
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    # Older manifests were keyed by slug; starting over just re-upserts everything
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+
+    return manifest["questions"]
+
+def save_manifest(manifest, path):
+    """Save manifest for the next incremental run"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "questions": manifest}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def pending_manifest_path(path):
+    """Where an incremental run leaves its manifest until the script has been applied"""
+    return f"{path}.pending"
+
+def batched(iterable, size):
+    """Yield lists of up to size items"""
+    iterator = iter(iterable)
+
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def upsert_questions_sql(questions):
+    """Multi-row upsert keyed on slug"""
+    values = ",\n".join(
+        f"('{q.leetcode_id}', '{q.title_sql}', '{q.slug}', '{q.difficulty}', '{q.description_sql}', '{q.url}', FALSE)"
+        for q in questions
+    )
+
+    return f"""INSERT INTO questions (leetcode_id, title, slug, difficulty, description, url, is_custom) VALUES
+{values}
+ON CONFLICT (slug) DO UPDATE SET
+  leetcode_id = EXCLUDED.leetcode_id,
+  title = EXCLUDED.title,
+  difficulty = EXCLUDED.difficulty,
+  description = EXCLUDED.description,
+  url = EXCLUDED.url;
+"""
+
+def question_stats_sql(catalogue, reconcile=False):
+    """Upsert the precomputed question_stats row from catalogue counts"""
+    tag_counts = json.dumps({tag: len(questions) for tag, questions in catalogue.by_tag.items()}, sort_keys=True)
+    category_counts = json.dumps({category: len(questions) for category, questions in catalogue.by_category.items()})
+
+    sql = f"""-- Precomputed question statistics
+INSERT INTO question_stats (id, total_questions, easy_count, medium_count, hard_count,
+                            custom_questions, leetcode_questions, tag_counts, category_counts, updated_at)
+VALUES (TRUE, {len(catalogue)}, {len(catalogue.by_difficulty.get("Easy", []))}, {len(catalogue.by_difficulty.get("Medium", []))}, {len(catalogue.by_difficulty.get("Hard", []))},
+        0, {len(catalogue)}, '{escape_sql_string(tag_counts)}', '{escape_sql_string(category_counts)}', NOW())
+ON CONFLICT (id) DO UPDATE SET
+  total_questions = EXCLUDED.total_questions,
+  easy_count = EXCLUDED.easy_count,
+  medium_count = EXCLUDED.medium_count,
+  hard_count = EXCLUDED.hard_count,
+  custom_questions = EXCLUDED.custom_questions,
+  leetcode_questions = EXCLUDED.leetcode_questions,
+  tag_counts = EXCLUDED.tag_counts,
+  category_counts = EXCLUDED.category_counts,
+  updated_at = EXCLUDED.updated_at;
+"""
+
+    # Upserts keep custom questions and rows outside this catalogue, so recount those from the tables
+    if reconcile:
+        sql += "SELECT refresh_question_stats();\n"
 
-        for leetcode_id, title, difficulty, description in questions:
-            slug = create_slug(title)
+    return sql
 
-            for tag in tags:
-                sql_content += f"""INSERT INTO question_tags (question_id, tag)
-SELECT q.id, '{tag}' FROM questions q WHERE q.slug = '{slug}';
+def insert_tags_sql(pairs):
+    """Set-based tag insert for (slug, tag) pairs, joined to questions once per statement"""
+    values = ",\n".join(f"('{slug}', '{escape_sql_string(tag)}')" for slug, tag in pairs)
+
+    return f"""INSERT INTO question_tags (question_id, tag)
+SELECT q.id, v.tag FROM (VALUES
+{values}
+) AS v(slug, tag) JOIN questions q USING (slug)
+ON CONFLICT DO NOTHING;
 """
 
-        sql_content += "\n"
+def sync_slugs_sql(questions):
+    """Move existing rows onto their new slug by leetcode_id, so a renamed title keeps its row and progress"""
+    values = ",\n".join(f"('{q.leetcode_id}', '{q.slug}', '{q.title_sql}', '{q.url}')" for q in questions)
 
-    return sql_content
+    return f"""UPDATE questions q SET slug = v.slug, title = v.title, url = v.url
+FROM (VALUES
+{values}
+) AS v(leetcode_id, slug, title, url)
+WHERE q.leetcode_id = v.leetcode_id AND q.slug <> v.slug;
+"""
 
-if __name__ == "__main__":
-    sql_script = generate_sql()
+def generate_upsert(catalogue, batch_size=DEFAULT_BATCH_SIZE):
+    """Generate SQL script of batched multi-row upserts, yielding it chunk by chunk"""
+
+    yield f"""-- LeetCode 150 Questions - Complete Dataset (batched upserts)
+-- Questions are upserted on slug in batches of {batch_size}; existing rows and user progress are kept
+
+"""
 
-    with open("leetcode_150_complete.sql", "w", encoding="utf-8") as f:
-        f.write(sql_script)
+    for batch in batched(catalogue, batch_size):
+        # Renames first, otherwise the slug upsert would collide on the unique leetcode_id
+        yield sync_slugs_sql(batch)
+        yield upsert_questions_sql(batch)
+        yield insert_tags_sql((q.slug, tag) for q in batch for tag in q.tags)
+        yield "\n"
 
-    print(f"Generated SQL script with {sum(len(questions) for questions in questions_data.values())} questions")
-    print("Saved to: leetcode_150_complete.sql")
+    yield question_stats_sql(catalogue, reconcile=True)
+
+def generate_incremental(catalogue, previous, current, batch_size=DEFAULT_BATCH_SIZE):
+    """Generate only the statements needed to move the database from previous to current manifest"""
+
+    yield """-- LeetCode 150 Questions - Incremental update
+-- Only questions whose content changed since the last manifest are touched
+
+BEGIN;
+
+"""
+
+    changed = (
+        q for q in catalogue
+        if previous.get(str(q.leetcode_id), {}).get("hash") != current[str(q.leetcode_id)]["hash"]
+    )
+
+    touched = False
+
+    for batch in batched(changed, batch_size):
+        touched = True
+        yield f"-- Add or update {len(batch)} questions\n"
+        # Renames first, otherwise the slug upsert would collide on the unique leetcode_id
+        yield sync_slugs_sql(batch)
+        yield upsert_questions_sql(batch)
+
+        added_tags = []
+
+        for q in batch:
+            old = previous.get(str(q.leetcode_id))
+            old_tags = set(old["tags"]) if old is not None else set()
+            new_tags = set(q.tags)
+
+            removed_tags = sorted(old_tags - new_tags)
+            if removed_tags:
+                tag_list = ", ".join(f"'{escape_sql_string(tag)}'" for tag in removed_tags)
+                yield f"""DELETE FROM question_tags
+WHERE question_id = (SELECT id FROM questions WHERE leetcode_id = '{q.leetcode_id}') AND tag IN ({tag_list});
+"""
+
+            added_tags.extend((q.slug, tag) for tag in sorted(new_tags - old_tags))
+
+        if added_tags:
+            yield insert_tags_sql(added_tags)
+
+        yield "\n"
+
+    removed = sorted(set(previous) - set(current), key=lambda leetcode_id: (len(leetcode_id), leetcode_id))
+
+    # Questions dropped from the catalogue are only deleted if nobody depends on them
+    for leetcode_id in removed:
+        yield f"""-- Remove {previous[leetcode_id]["slug"]}
+DELETE FROM questions q
+WHERE q.leetcode_id = '{escape_sql_string(leetcode_id)}'
+  AND NOT EXISTS (SELECT 1 FROM user_question_progress p WHERE p.question_id = q.id)
+  AND NOT EXISTS (SELECT 1 FROM path_questions pq WHERE pq.question_id = q.id);
+
+"""
+
+    # Counts only move when rows do
+    if touched or removed:
+        yield question_stats_sql(catalogue, reconcile=True)
+        yield "\n"
+
+    yield "COMMIT;\n"
+
+def shard_key(slug, shard_count):
+    """Stable hash bucket for a slug"""
+    return int(hashlib.sha1(slug.encode("utf-8")).hexdigest(), 16) % shard_count
+
+def partition_questions(catalogue, shard_by, shard_count):
+    """Split the catalogue into [(name, questions)] by category or by slug hash range"""
+    if shard_by == "category":
+        return [
+            (re.sub(r"[^a-z0-9]+", "-", category.lower()).strip("-"), questions)
+            for category, questions in catalogue.by_category.items()
+            if questions
+        ]
+
+    buckets = [[] for _ in range(shard_count)]
+    for q in catalogue:
+        buckets[shard_key(q.slug, shard_count)].append(q)
+    return [(f"hash-{index}", questions) for index, questions in enumerate(buckets) if questions]
+
+def write_shard(shards_dir, index, name, questions, batch_size):
+    """Render one shard's question and tag files; runs in a worker process"""
+    questions_file = os.path.join("questions", f"{index:03d}-{name}.sql")
+    tags_file = os.path.join("question_tags", f"{index:03d}-{name}.sql")
+
+    with open(os.path.join(shards_dir, questions_file), "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(f"-- Shard {name}: {len(questions)} questions\n")
+        for batch in batched(questions, batch_size):
+            f.write(sync_slugs_sql(batch))
+            f.write(upsert_questions_sql(batch))
+
+    with open(os.path.join(shards_dir, tags_file), "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(f"-- Shard {name}: tags\n")
+        for batch in batched(questions, batch_size):
+            f.write(insert_tags_sql((q.slug, tag) for q in batch for tag in q.tags))
+
+    return questions_file, tags_file
+
+def generate_shards(catalogue, shards_dir, shard_by="category", shard_count=8, batch_size=DEFAULT_BATCH_SIZE, workers=None):
+    """Render shards in a process pool and write their dependency manifest"""
+    shards = partition_questions(catalogue, shard_by, shard_count)
+
+    for stage in ("questions", "question_tags", "path_questions"):
+        os.makedirs(os.path.join(shards_dir, stage), exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(write_shard, shards_dir, index, name, questions, batch_size)
+            for index, (name, questions) in enumerate(shards)
+        ]
+        files = [future.result() for future in futures]
+
+    with open(os.path.join(shards_dir, STATS_FILE), "w", encoding="utf-8") as f:
+        f.write(question_stats_sql(catalogue, reconcile=True))
+
+    # Copy the path seeds in so the shard directory can be loaded from any machine
+    path_files = []
+    for path in PATH_SEED_FILES:
+        path_file = f"path_questions/{os.path.basename(path)}"
+        shutil.copyfile(path, os.path.join(shards_dir, path_file))
+        path_files.append(path_file)
+
+    # Stages load in order; files within a parallel stage are independent of each other
+    manifest = {
+        "stages": [
+            {"name": "questions", "parallel": True, "files": [questions_file for questions_file, tags_file in files]},
+            {"name": "question_tags", "parallel": True, "files": [tags_file for questions_file, tags_file in files]},
+            {"name": "path_questions", "parallel": False, "files": path_files},
+            {"name": "question_stats", "parallel": False, "files": [STATS_FILE]},
+        ]
+    }
+
+    with open(os.path.join(shards_dir, SHARD_MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    return manifest
+
+def write_sql(chunks, output):
+    """Write chunks to a path, or to stdout when output is '-'"""
+    if output == "-":
+        stream = sys.stdout
+        stream.writelines(chunks)
+        stream.flush()
+        return
+
+    with open(output, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        f.writelines(chunks)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate SQL seed script for LeetCode questions")
+    parser.add_argument("--format", choices=["insert", "copy", "upsert"], default="insert",
+                        help="insert: one INSERT per row (default); copy: COPY ... FROM STDIN blocks; "
+                             "upsert: batched multi-row INSERT ... ON CONFLICT DO UPDATE")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"rows per statement for upsert and incremental output (default {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("-o", "--output", default="leetcode_150_complete.sql",
+                        help="output file, or '-' for stdout (e.g. to pipe into psql)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="emit only upserts/tag changes for questions that changed since the last manifest")
+    parser.add_argument("--manifest", default="leetcode_150_manifest.json",
+                        help="manifest of per-question content hashes used by --incremental")
+    parser.add_argument("--commit-manifest", action="store_true",
+                        help="promote the pending manifest from the last --incremental run once its script has been applied")
+    parser.add_argument("--catalogue", action="append", metavar="PATH",
+                        help="JSON, JSONL or CSV catalogue to load; repeat to merge several (default: bundled Top 150)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always reparse catalogues instead of using the compiled cache")
+    parser.add_argument("--shards-dir", metavar="DIR",
+                        help="write sharded upsert files plus a dependency manifest into DIR (load with load_shards.py)")
+    parser.add_argument("--shard-by", choices=["category", "hash"], default="category",
+                        help="split shards by catalogue category (default) or by slug hash range")
+    parser.add_argument("--shards", type=int, default=8,
+                        help="number of hash shards for --shard-by hash (default 8)")
+    parser.add_argument("--workers", type=int,
+                        help="worker processes for shard rendering (default: CPU count)")
+    parser.add_argument("--load", action="store_true",
+                        help="upsert straight into PostgreSQL via COPY (uses DB_HOST/DB_PORT/DB_NAME/DB_USER/DB_PASSWORD)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="connections for --load; above 1, hash partitions load concurrently, one transaction each")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="with --load, write the equivalent upsert SQL to --output instead of connecting")
+    parser.add_argument("--enrich", action="store_true",
+                        help="replace category-derived tags and difficulty with LeetCode topicTags (cached per slug)")
+    parser.add_argument("--enrich-endpoint", default=LEETCODE_ENDPOINT,
+                        help="GraphQL endpoint for --enrich (default: LeetCode)")
+    parser.add_argument("--enrich-concurrency", type=int, default=4,
+                        help="maximum in-flight requests for --enrich (default 4)")
+    parser.add_argument("--enrich-rate", type=float, default=2.0,
+                        help="maximum requests per second for --enrich (default 2)")
+    parser.add_argument("--enrich-cache", default=ENRICH_CACHE_DIR,
+                        help="directory of cached responses for --enrich")
+    parser.add_argument("--enrich-ttl", type=float, default=ENRICH_TTL,
+                        help=f"seconds before a cached response is refetched (default {ENRICH_TTL})")
+    parser.add_argument("--snapshot", metavar="PATH",
+                        help="also write a memory-mappable columnar catalogue snapshot (read with snapshot.Snapshot)")
+    parser.add_argument("--ndjson", metavar="PATH",
+                        help="also write the catalogue as NDJSON for the TypeScript side")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="write a JSON report of per-stage timings, statement counts and output size ('-' for stderr)")
+    args = parser.parse_args()
+
+    if args.commit_manifest:
+        pending = pending_manifest_path(args.manifest)
+        if not os.path.exists(pending):
+            parser.error(f"no pending manifest at {pending}; run --incremental first")
+        os.replace(pending, args.manifest)
+        print(f"Committed manifest: {args.manifest}")
+        sys.exit(0)
+
+    if args.load and (args.incremental or args.shards_dir):
+        parser.error("--load cannot be combined with --incremental or --shards-dir")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.enrich_concurrency < 1 or args.enrich_rate <= 0:
+        parser.error("--enrich-concurrency must be at least 1 and --enrich-rate positive")
+    if args.load and args.dry_run:
+        args.format = "upsert"
+
+    mode = "incremental" if args.incremental else "shards" if args.shards_dir else "load" if args.load and not args.dry_run else args.format
+    profile = SeedProfile(mode=mode, batch_size=args.batch_size)
+
+    if args.incremental and args.format == "copy":
+        parser.error("--incremental cannot be combined with --format copy")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    if args.shards_dir and args.incremental:
+        parser.error("--shards-dir cannot be combined with --incremental")
+    if args.shards < 1:
+        parser.error("--shards must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    try:
+        with profile.stage("load"):
+            questions_data = load_catalogues(args.catalogue or [BUNDLED_CATALOGUE], use_cache=not args.no_cache)
+        with profile.stage("catalogue"):
+            catalogue = build_catalogue(questions_data)
+    except (CatalogueError, OSError) as e:
+        print(f"Invalid catalogue: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.enrich:
+        with profile.stage("enrich"):
+            catalogue, failures = enrich_catalogue(
+                catalogue,
+                endpoint=args.enrich_endpoint,
+                cache=ResponseCache(args.enrich_cache, args.enrich_ttl),
+                concurrency=args.enrich_concurrency,
+                rate=args.enrich_rate,
+            )
+
+        for slug, error in sorted(failures.items()):
+            print(f"Enrichment skipped {slug}: {error}", file=sys.stderr)
+
+    profile.info["questions"] = len(catalogue)
+
+    if args.snapshot:
+        with profile.stage("snapshot"):
+            write_snapshot(catalogue, args.snapshot)
+    if args.ndjson:
+        with profile.stage("ndjson"):
+            write_ndjson(catalogue, args.ndjson)
+
+    if args.shards_dir:
+        with profile.stage("shards"):
+            manifest = generate_shards(catalogue, args.shards_dir, args.shard_by, args.shards, args.batch_size, args.workers)
+        if args.profile:
+            profile.save(args.profile)
+        print(f"Generated {len(manifest['stages'][0]['files'])} shards with {len(catalogue)} questions")
+        print(f"Saved to: {args.shards_dir}")
+        sys.exit(0)
+
+    if args.load and not args.dry_run:
+        if args.jobs == 1:
+            partitions = [catalogue.questions]
+        else:
+            partitions = [questions for name, questions in partition_questions(catalogue, "hash", args.jobs)]
+
+        try:
+            with profile.stage("load_database"):
+                loaded = load_partitions(partitions, args.jobs, question_stats_sql(catalogue, reconcile=True))
+        except Exception as e:
+            print(f"Load failed: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        if args.profile:
+            profile.save(args.profile)
+        print(f"Loaded {loaded} questions into {os.environ.get('DB_NAME', 'leettrack')}")
+        sys.exit(0)
+
+    if args.incremental:
+        previous = load_manifest(args.manifest)
+        with profile.stage("manifest"):
+            current = build_manifest(catalogue)
+        chunks = generate_incremental(catalogue, previous, current, args.batch_size)
+    elif args.format == "copy":
+        chunks = generate_copy(catalogue)
+    elif args.format == "upsert":
+        chunks = generate_upsert(catalogue, args.batch_size)
+    else:
+        chunks = generate_sql(catalogue)
+
+    if args.profile:
+        chunks = profile.count(chunks)
+
+    with profile.stage("write"):
+        write_sql(chunks, args.output)
+
+    if args.profile:
+        # Rendering happens lazily inside write_sql; report the two separately
+        profile.stages["write"] -= profile.stages["render"]
+        profile.save(args.profile)
+
+    # Only promoted by --commit-manifest once the database has actually applied the script
+    if args.incremental:
+        save_manifest(current, pending_manifest_path(args.manifest))
+
+    # Keep stdout clean when it carries the SQL itself
+    log = sys.stderr if args.output == "-" else sys.stdout
+    print(f"Generated SQL script with {len(catalogue)} questions", file=log)
+    if args.incremental:
+        changed = sum(1 for leetcode_id, entry in current.items() if previous.get(leetcode_id, {}).get("hash") != entry["hash"])
+        removed = len(set(previous) - set(current))
+        print(f"Incremental: {changed} added/changed, {removed} removed", file=log)
+    print(f"Saved to: {'stdout' if args.output == '-' else args.output}", file=log)
+    if args.incremental:
+        print(f"Apply it, then run with --commit-manifest to record {args.manifest}", file=log)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Load sharded seed files produced by generate_questions.py --shards-dir
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from db_loader import psql
+
+SHARD_MANIFEST = "manifest.json"
+
+def load_file(path):
+    """Apply one SQL file over its own connection"""
+    result = psql("-f", path, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{path}: {result.stderr.strip()}")
+
+    return path
+
+def load_shards(shards_dir, jobs=4):
+    """Apply manifest stages in order, running files within a parallel stage concurrently"""
+    with open(os.path.join(shards_dir, SHARD_MANIFEST), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    for stage in manifest["stages"]:
+        paths = [os.path.join(shards_dir, path) for path in stage["files"]]
+        print(f"Loading {stage['name']} ({len(paths)} files)")
+
+        if stage.get("parallel") and jobs > 1:
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                list(pool.map(load_file, paths))
+        else:
+            for path in paths:
+                load_file(path)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load sharded seed files into PostgreSQL")
+    parser.add_argument("shards_dir", help="directory written by generate_questions.py --shards-dir")
+    parser.add_argument("-j", "--jobs", type=int, default=4,
+                        help="concurrent connections per stage (default 4)")
+    args = parser.parse_args()
+
+    try:
+        load_shards(args.shards_dir, args.jobs)
+    except (OSError, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print("All shards loaded")
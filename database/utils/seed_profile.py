@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Per-stage timings and output counters for the seed pipeline
+"""
+
+import json
+import resource
+import sys
+import time
+from contextlib import contextmanager
+
+class SeedProfile:
+    """Collects stage timings, statement counts and output size for one generator run"""
+
+    def __init__(self, **info):
+        self.info = info
+        self.stages = {}
+        self.statements = 0
+        self.chunks = 0
+        self.output_bytes = 0
+
+    @contextmanager
+    def stage(self, name):
+        """Time a block and add it to the named stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def count(self, chunks, render_stage="render"):
+        """Pass chunks through, timing the generator itself and counting statements and bytes"""
+        iterator = iter(chunks)
+        render = 0.0
+
+        while True:
+            start = time.perf_counter()
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                break
+            render += time.perf_counter() - start
+
+            self.chunks += 1
+            self.statements += chunk.count(";\n")
+            self.output_bytes += len(chunk.encode("utf-8"))
+            yield chunk
+
+        self.stages[render_stage] = self.stages.get(render_stage, 0.0) + render
+
+    def report(self):
+        """JSON-serialisable summary"""
+        # ru_maxrss is KiB on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak_bytes = peak if sys.platform == "darwin" else peak * 1024
+
+        return {
+            **self.info,
+            "stages": {name: round(seconds, 6) for name, seconds in self.stages.items()},
+            "total_seconds": round(sum(self.stages.values()), 6),
+            "statements": self.statements,
+            "chunks": self.chunks,
+            "output_bytes": self.output_bytes,
+            "peak_rss_bytes": peak_bytes,
+        }
+
+    def save(self, path):
+        """Write the report as JSON, or to stderr when path is '-'"""
+        text = json.dumps(self.report(), indent=2) + "\n"
+
+        if path == "-":
+            sys.stderr.write(text)
+            return
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Columnar, memory-mappable catalogue snapshot and NDJSON export
+
+Layout (little-endian), all sections 8-byte aligned:
+
+  header        magic, version, row/category counts and the offset of every section
+  ids           u32 leetcode_id per row; rows are sorted by leetcode_id
+  difficulty    u8 index into DIFFICULTIES per row
+  category      u16 index into the category table per row
+  title, slug,
+  description,
+  tags          (u32 offset, u32 length) pairs into the string table per row;
+                tags are joined with TAG_SEPARATOR
+  slug_index    u32 row numbers sorted by slug bytes
+  categories    (u32 offset, u32 length) pairs into the string table
+  strings       deduplicated UTF-8 string table
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"LTSNAP\x00\x01"
+VERSION = 1
+DIFFICULTIES = ("Easy", "Medium", "Hard")
+TAG_SEPARATOR = "\x1f"
+
+# magic, version, rows, categories, then offsets of ids, difficulty, category, title, slug,
+# description, tags, slug_index, categories, strings, and the string table size
+HEADER = struct.Struct("<8sIII10QQ")
+STRING_COLUMNS = ("title", "slug", "description", "tags")
+
+class SnapshotError(ValueError):
+    """Raised when a file is not a snapshot this reader understands"""
+
+def align(offset):
+    return (offset + 7) & ~7
+
+class StringTable:
+    """Deduplicating UTF-8 string table builder"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = {}
+
+    def add(self, value):
+        """(offset, length) of value, appending it the first time it is seen"""
+        ref = self.offsets.get(value)
+        if ref is None:
+            encoded = value.encode("utf-8")
+            ref = (len(self.data), len(encoded))
+            self.data += encoded
+            self.offsets[value] = ref
+        return ref
+
+def write_snapshot(catalogue, path):
+    """Write catalogue as a snapshot file"""
+    if sys.byteorder != "little":
+        raise SnapshotError("Snapshots can only be written on little-endian hosts")
+
+    questions = sorted(catalogue, key=lambda q: q.leetcode_id)
+    categories = list(dict.fromkeys(q.category for q in questions))
+    category_index = {category: index for index, category in enumerate(categories)}
+    strings = StringTable()
+    rows = len(questions)
+
+    refs = {column: [] for column in STRING_COLUMNS}
+    for q in questions:
+        refs["title"].append(strings.add(q.title))
+        refs["slug"].append(strings.add(q.slug))
+        refs["description"].append(strings.add(q.description))
+        refs["tags"].append(strings.add(TAG_SEPARATOR.join(q.tags)))
+    category_refs = [strings.add(category) for category in categories]
+
+    slug_index = sorted(range(rows), key=lambda row: questions[row].slug.encode("utf-8"))
+
+    sections = [
+        struct.pack(f"<{rows}I", *(q.leetcode_id for q in questions)),
+        bytes(DIFFICULTIES.index(q.difficulty) for q in questions),
+        struct.pack(f"<{rows}H", *(category_index[q.category] for q in questions)),
+        *(struct.pack(f"<{2 * rows}I", *(value for ref in refs[column] for value in ref)) for column in STRING_COLUMNS),
+        struct.pack(f"<{rows}I", *slug_index),
+        struct.pack(f"<{2 * len(categories)}I", *(value for ref in category_refs for value in ref)),
+        bytes(strings.data),
+    ]
+
+    offsets = []
+    position = align(HEADER.size)
+    for section in sections:
+        offsets.append(position)
+        position = align(position + len(section))
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, rows, len(categories), *offsets, len(strings.data)))
+
+        for offset, section in zip(offsets, sections):
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(section)
+
+def write_ndjson(catalogue, path):
+    """One JSON object per question, shaped like the TypeScript Question type minus the database-assigned id"""
+    with open(path, "w", encoding="utf-8") as f:
+        for q in catalogue:
+            f.write(json.dumps({
+                "leetcode_id": str(q.leetcode_id),
+                "title": q.title,
+                "slug": q.slug,
+                "difficulty": q.difficulty,
+                "description": q.description,
+                "tags": list(q.tags),
+                "url": q.url,
+                "is_custom": False,
+                "category": q.category,
+            }, ensure_ascii=False))
+            f.write("\n")
+
+class SlugKeys:
+    """Sequence view of the slug index as bytes, for bisect"""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+
+    def __len__(self):
+        return len(self.snapshot)
+
+    def __getitem__(self, position):
+        return self.snapshot.string_bytes("slug", self.snapshot.slug_index[position])
+
+class Snapshot:
+    """Read-only mmap view of a snapshot; lookups touch only the pages they need"""
+
+    def __init__(self, path):
+        if sys.byteorder != "little":
+            raise SnapshotError("Snapshots can only be read on little-endian hosts")
+
+        with open(path, "rb") as f:
+            # mmap refuses empty files, so check the size before mapping
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise SnapshotError(f"{path} is not a catalogue snapshot")
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.rows, category_count, *offsets, strings_size = HEADER.unpack_from(self.mm)
+        if magic != MAGIC or version != VERSION:
+            self.mm.close()
+            raise SnapshotError(f"{path} is not a version {VERSION} catalogue snapshot")
+
+        rows = self.rows
+        sizes = (4 * rows, rows, 2 * rows, *[8 * rows] * len(STRING_COLUMNS), 4 * rows, 8 * category_count, strings_size)
+        for offset, size in zip(offsets, sizes):
+            if offset % 8 or offset < HEADER.size or offset + size > len(self.mm):
+                self.mm.close()
+                raise SnapshotError(f"{path} is truncated or corrupt")
+
+        ids, difficulty, category, title, slug, description, tags, slug_index, categories, strings = offsets
+        view = memoryview(self.mm)
+
+        self.ids = view[ids:ids + 4 * rows].cast("I")
+        self.difficulty = view[difficulty:difficulty + rows]
+        self.category = view[category:category + 2 * rows].cast("H")
+        self.refs = {
+            "title": view[title:title + 8 * rows].cast("I"),
+            "slug": view[slug:slug + 8 * rows].cast("I"),
+            "description": view[description:description + 8 * rows].cast("I"),
+            "tags": view[tags:tags + 8 * rows].cast("I"),
+        }
+        self.slug_index = view[slug_index:slug_index + 4 * rows].cast("I")
+        self.category_refs = view[categories:categories + 8 * category_count].cast("I")
+        self.strings = view[strings:strings + strings_size]
+
+    def __len__(self):
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the views and the mapping"""
+        for name in ("ids", "difficulty", "category", "slug_index", "category_refs", "strings"):
+            getattr(self, name).release()
+        for ref in self.refs.values():
+            ref.release()
+        self.mm.close()
+
+    def string_bytes(self, column, row):
+        """Raw UTF-8 bytes of a string column for row"""
+        offset, length = self.refs[column][2 * row], self.refs[column][2 * row + 1]
+        return bytes(self.strings[offset:offset + length])
+
+    def row(self, row):
+        """Decode one row into a dict"""
+        category = self.category[row]
+        category_offset, category_length = self.category_refs[2 * category], self.category_refs[2 * category + 1]
+        slug = self.string_bytes("slug", row).decode("utf-8")
+        tags = self.string_bytes("tags", row).decode("utf-8")
+
+        return {
+            "leetcode_id": self.ids[row],
+            "title": self.string_bytes("title", row).decode("utf-8"),
+            "slug": slug,
+            "difficulty": DIFFICULTIES[self.difficulty[row]],
+            "category": bytes(self.strings[category_offset:category_offset + category_length]).decode("utf-8"),
+            "description": self.string_bytes("description", row).decode("utf-8"),
+            "tags": tags.split(TAG_SEPARATOR) if tags else [],
+            "url": f"https://leetcode.com/problems/{slug}/",
+        }
+
+    def find_leetcode_id(self, leetcode_id):
+        """Row for leetcode_id, or None; binary search over the sorted id column"""
+        row = bisect.bisect_left(self.ids, leetcode_id)
+        if row < self.rows and self.ids[row] == leetcode_id:
+            return self.row(row)
+        return None
+
+    def find_slug(self, slug):
+        """Row for slug, or None; binary search over the slug index"""
+        key = slug.encode("utf-8")
+        keys = SlugKeys(self)
+        position = bisect.bisect_left(keys, key)
+        if position < self.rows and keys[position] == key:
+            return self.row(self.slug_index[position])
+        return None
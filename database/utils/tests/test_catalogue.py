@@ -0,0 +1,101 @@
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from catalogue import Catalogue, CatalogueError, Question, create_slug
+from generate_questions import BUNDLED_CATALOGUE, build_catalogue, generate_sql, load_catalogues, parse_catalogue
+
+SEED_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                         "seed", "insert-all-150-questions.sql")
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "generate_questions.py")
+
+def bundled_catalogue():
+    return build_catalogue(load_catalogues([BUNDLED_CATALOGUE], use_cache=False))
+
+def test_create_slug_collapses_hyphens():
+    assert create_slug("Two Sum II - Input Array Is Sorted") == "two-sum-ii-input-array-is-sorted"
+    assert create_slug("Insert Delete GetRandom O(1)") == "insert-delete-getrandom-o1"
+    assert create_slug("Pow(x, n)") == "powx-n"
+
+def test_bundled_slugs_match_checked_in_seed():
+    with open(SEED_FILE, encoding="utf-8") as f:
+        seeded = re.findall(r"VALUES \('(?:[^']|'')*', '([a-z0-9-]+)', '\w+', '[^']*', '(\d+)'", f.read())
+    catalogue = bundled_catalogue()
+
+    # A row seeded by setup_complete.sh under another slug would make a reseed collide on leetcode_id
+    for slug, leetcode_id in seeded:
+        q = catalogue.by_leetcode_id.get(int(leetcode_id))
+        if q is not None:
+            assert q.slug == slug
+
+def test_unmapped_category_tag_is_escaped_in_insert_mode():
+    catalogue = Catalogue({"Bob's Picks": [(1, "Two Sum", "Easy", "Add two numbers.")]}, {})
+    sql = "".join(generate_sql(catalogue))
+
+    assert "SELECT q.id, 'Bob''s Picks' FROM questions q WHERE q.slug = 'two-sum';" in sql
+
+def test_tag_longer_than_column_is_rejected():
+    with pytest.raises(CatalogueError, match="longer than 50"):
+        Catalogue({"Misc": [(1, "Two Sum", "Easy", "")]}, {"Misc": ["x" * 51]})
+
+def test_null_or_missing_description_is_empty_in_every_format(tmp_path):
+    jsonl = tmp_path / "questions.jsonl"
+    jsonl.write_text('{"category": "Array", "leetcode_id": 1, "title": "Two Sum", "difficulty": "Easy", "description": null}\n'
+                     '{"category": "Array", "leetcode_id": 2, "title": "Add Two Numbers", "difficulty": "Medium"}\n')
+    json_file = tmp_path / "questions.json"
+    json_file.write_text('{"Array": [{"leetcode_id": 1, "title": "Two Sum", "difficulty": "Easy", "description": null}]}')
+    csv_file = tmp_path / "questions.csv"
+    csv_file.write_text("category,leetcode_id,title,difficulty,description\nArray,1,Two Sum,Easy,\n")
+
+    assert parse_catalogue(str(jsonl)) == {"Array": [(1, "Two Sum", "Easy", ""), (2, "Add Two Numbers", "Medium", "")]}
+    assert parse_catalogue(str(json_file)) == {"Array": [(1, "Two Sum", "Easy", "")]}
+    assert parse_catalogue(str(csv_file)) == {"Array": [(1, "Two Sum", "Easy", "")]}
+
+def test_bad_rows_report_file_and_line(tmp_path):
+    csv_file = tmp_path / "questions.csv"
+    csv_file.write_text("category,leetcode_id,title,difficulty,description\nArray,1,Two Sum,Easy,\nArray,,Add Two Numbers,Medium,\n")
+    jsonl = tmp_path / "questions.jsonl"
+    jsonl.write_text('{"category": "Array", "leetcode_id": 1, "title": "Two Sum", "difficulty": "Easy"}\n'
+                     '{"category": "Array", "title": "Add Two Numbers", "difficulty": "Medium"}\n')
+
+    with pytest.raises(CatalogueError, match=re.escape(f"{csv_file}:3:")):
+        parse_catalogue(str(csv_file))
+    with pytest.raises(CatalogueError, match=re.escape(f"{jsonl}:2: missing field 'leetcode_id'")):
+        parse_catalogue(str(jsonl))
+
+def test_bad_catalogue_exits_with_message(tmp_path):
+    unsupported = tmp_path / "questions.txt"
+    unsupported.write_text("")
+
+    for path in (tmp_path / "missing.jsonl", unsupported):
+        result = subprocess.run([sys.executable, SCRIPT, "--catalogue", str(path), "-o", os.devnull],
+                                capture_output=True, text=True)
+
+        assert result.returncode == 1
+        assert result.stderr.startswith("Invalid catalogue:")
+        assert "Traceback" not in result.stderr
+
+@pytest.mark.parametrize("rows, message", [
+    ([(1, "Über Problem", "Easy", "")], "invalid slug 'über-problem'"),
+    ([(1, "Two Sum", "Easy", ""), (2, "Two-Sum", "Easy", "")], "Duplicate slug 'two-sum' for questions 1 and 2"),
+    ([(1, "Two Sum", "Easy", ""), (1, "Add Two Numbers", "Medium", "")], "Duplicate leetcode_id 1"),
+    ([(1, "Two Sum", "Trivial", "")], "invalid difficulty 'Trivial'"),
+    ([(1, " Ab ", "Easy", "")], "shorter than 3 characters"),
+])
+def test_invalid_rows_are_rejected(rows, message):
+    with pytest.raises(CatalogueError, match=re.escape(message)):
+        Catalogue({"Array / String": rows}, {})
+
+def test_rejected_row_leaves_indexes_untouched():
+    catalogue = Catalogue({"Array / String": [(1, "Two Sum", "Easy", "")]}, {})
+
+    with pytest.raises(CatalogueError):
+        catalogue.add(Question(2, "Two Sum", "Easy", "", "Array / String", ["Array"]))
+
+    assert len(catalogue) == 1
+    assert 2 not in catalogue.by_leetcode_id
+    assert catalogue.by_tag == {"Array / String": [catalogue.by_leetcode_id[1]]}
@@ -0,0 +1,20 @@
+import os
+
+import generate_questions
+from generate_questions import BUNDLED_CATALOGUE, load_catalogue, parse_catalogue
+
+def test_cache_is_written_and_reused(tmp_path, monkeypatch):
+    monkeypatch.setattr(generate_questions, "CACHE_DIR", str(tmp_path / "cache"))
+
+    data = load_catalogue(BUNDLED_CATALOGUE)
+    assert data == parse_catalogue(BUNDLED_CATALOGUE)
+    assert len(os.listdir(tmp_path / "cache")) == 1
+    assert load_catalogue(BUNDLED_CATALOGUE) == data
+
+def test_unwritable_cache_dir_is_not_fatal(tmp_path, monkeypatch):
+    # A file where the cache directory should be makes every cache write fail, even as root
+    blocker = tmp_path / "read-only"
+    blocker.write_text("")
+    monkeypatch.setattr(generate_questions, "CACHE_DIR", str(blocker / "cache"))
+
+    assert load_catalogue(BUNDLED_CATALOGUE) == parse_catalogue(BUNDLED_CATALOGUE)
@@ -0,0 +1,51 @@
+from catalogue import Catalogue, Question, escape_copy_value, question_uuid
+from generate_questions import BUNDLED_CATALOGUE, build_catalogue, generate_copy, load_catalogues
+
+TITLE = "Tab\there\\n"
+DESCRIPTION = "Line one\nline two\r\nback\\slash\tand tab"
+
+def tricky_catalogue():
+    q = Question(1, TITLE, "Easy", DESCRIPTION, "Array / String", ["Array", "Two\tPointers"])
+    # Such a title can't produce a valid slug, so pin one for the test
+    q.slug = "tricky-title"
+    q.url = "https://leetcode.com/problems/tricky-title/"
+    q.uuid = question_uuid(q.slug)
+
+    catalogue = Catalogue({}, {})
+    catalogue.add(q)
+    return catalogue
+
+def copy_rows(sql, table):
+    """Data lines of the COPY block for table"""
+    block = sql.split(f"COPY {table} ", 1)[1].split("\n", 1)[1]
+    return block.split("\\.\n", 1)[0].splitlines(keepends=True)
+
+def test_escape_copy_value():
+    assert escape_copy_value("a\tb\nc\rd\\e") == "a\\tb\\nc\\rd\\\\e"
+
+def test_question_row_is_escaped_tsv():
+    sql = "".join(generate_copy(tricky_catalogue()))
+
+    assert copy_rows(sql, "questions") == [
+        f"{question_uuid('tricky-title')}\t1\tTab\\there\\\\n\ttricky-title\tEasy\t"
+        "Line one\\nline two\\r\\nback\\\\slash\\tand tab\t"
+        "https://leetcode.com/problems/tricky-title/\tf\n"
+    ]
+
+def test_tag_rows_reference_slug_uuid():
+    sql = "".join(generate_copy(tricky_catalogue()))
+    uuid = question_uuid("tricky-title")
+
+    assert copy_rows(sql, "question_tags") == [f"{uuid}\tArray\n", f"{uuid}\tTwo\\tPointers\n"]
+
+def test_bundled_tag_rows_reference_their_question():
+    catalogue = build_catalogue(load_catalogues([BUNDLED_CATALOGUE], use_cache=False))
+    sql = "".join(generate_copy(catalogue))
+
+    question_ids = {line.split("\t")[0]: line.split("\t")[3] for line in copy_rows(sql, "questions")}
+    tag_rows = copy_rows(sql, "question_tags")
+
+    assert len(tag_rows) == sum(len(q.tags) for q in catalogue)
+    for line in tag_rows:
+        uuid = line.split("\t")[0]
+        assert uuid == question_uuid(question_ids[uuid])
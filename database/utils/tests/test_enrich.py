@@ -0,0 +1,118 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from catalogue import Catalogue
+from enrich import ResponseCache, apply_details, enrich_details
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Fails the first request for each slug in rate_limited or challenged, and doesn't know 'candy'"""
+
+    rate_limited = {"merge-sorted-array"}
+    # Served a 200 HTML page first, like a bot challenge
+    challenged = {"valid-palindrome"}
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        slug = body["variables"]["titleSlug"]
+        self.server.hits[slug] += 1
+
+        if slug in self.rate_limited and self.server.hits[slug] == 1:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+
+        if slug in self.challenged and self.server.hits[slug] == 1:
+            page = b"<html>Just a moment...</html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+            return
+
+        question = None if slug == "candy" else {
+            "questionFrontendId": "88",
+            "titleSlug": slug,
+            "difficulty": "Easy",
+            "topicTags": [{"name": "Array", "slug": "array"}],
+            "stats": "{}",
+        }
+        payload = json.dumps({"data": {"question": question}}).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.hits = Counter()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+def run(slugs, server, cache):
+    endpoint = f"http://127.0.0.1:{server.server_port}/graphql"
+    return asyncio.run(enrich_details(slugs, endpoint=endpoint, cache=cache, rate=1000, backoff=0.01, timeout=5))
+
+def test_retries_caches_missing_and_reruns_offline(stub_server, tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=3600)
+    slugs = ["merge-sorted-array", "valid-palindrome", "candy"]
+
+    details, failures = run(slugs, stub_server, cache)
+
+    # 429 then success
+    assert stub_server.hits["merge-sorted-array"] == 2
+    assert details["merge-sorted-array"]["topicTags"] == [{"name": "Array", "slug": "array"}]
+    # Non-JSON page then success
+    assert stub_server.hits["valid-palindrome"] == 2
+    assert "valid-palindrome" in details
+    # Unknown slug is reported and remembered as empty
+    assert failures == {"candy": "Question not found"}
+    assert cache.get("candy") == {}
+
+    stub_server.hits.clear()
+    details, failures = run(slugs, stub_server, cache)
+
+    assert sum(stub_server.hits.values()) == 0
+    assert failures == {}
+    assert details["candy"] == {}
+    assert details["valid-palindrome"]["difficulty"] == "Easy"
+
+def test_evict_expired_removes_stale_and_unreadable_entries(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60)
+    cache.put("fresh", {"difficulty": "Easy"})
+    cache.put("stale", {"difficulty": "Hard"})
+    with open(cache.path("stale"), "w", encoding="utf-8") as f:
+        json.dump({"fetched_at": time.time() - 120, "data": {}}, f)
+    with open(cache.path("broken"), "w", encoding="utf-8") as f:
+        f.write("{")
+
+    assert cache.evict_expired() == 2
+    assert sorted(os.listdir(tmp_path)) == ["fresh.json"]
+
+def test_apply_details_ignores_values_the_schema_would_reject():
+    catalogue = Catalogue({"Array / String": [(88, "Merge Sorted Array", "Easy", "")]}, {"Array / String": ["Array"]})
+    details = {"merge-sorted-array": {"difficulty": "Unknown", "topicTags": [{"name": "x" * 51}]}}
+
+    q = next(iter(apply_details(catalogue, details)))
+
+    assert q.difficulty == "Easy"
+    assert q.tags == ("Array",)
@@ -0,0 +1,120 @@
+import json
+import os
+import subprocess
+import sys
+
+from catalogue import Catalogue
+from generate_questions import (
+    build_manifest,
+    category_tags_map,
+    generate_incremental,
+    load_manifest,
+    pending_manifest_path,
+    save_manifest,
+)
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "generate_questions.py")
+
+def make_catalogue(rows, category="Two Pointers"):
+    return Catalogue({category: rows}, category_tags_map)
+
+BASE_ROWS = [
+    (88, "Merge Sorted Array", "Easy", "Merge two sorted arrays."),
+    (125, "Valid Palindrome", "Easy", "Check for a palindrome."),
+]
+
+def incremental_sql(previous_catalogue, current_catalogue):
+    previous = build_manifest(previous_catalogue) if previous_catalogue is not None else {}
+    current = build_manifest(current_catalogue)
+    return "".join(generate_incremental(current_catalogue, previous, current))
+
+def test_first_run_adds_everything():
+    sql = incremental_sql(None, make_catalogue(BASE_ROWS))
+
+    assert "'merge-sorted-array'" in sql
+    assert "'valid-palindrome'" in sql
+    assert "DELETE FROM questions" not in sql
+    assert "refresh_question_stats" in sql
+
+def test_unchanged_catalogue_is_empty_transaction():
+    catalogue = make_catalogue(BASE_ROWS)
+    sql = incremental_sql(catalogue, catalogue)
+
+    assert "INSERT" not in sql
+    assert "question_stats" not in sql
+    assert sql.endswith("BEGIN;\n\nCOMMIT;\n")
+
+def test_changed_description_only_touches_that_row():
+    previous = make_catalogue(BASE_ROWS)
+    current = make_catalogue([BASE_ROWS[0], (125, "Valid Palindrome", "Easy", "New description.")])
+    sql = incremental_sql(previous, current)
+
+    assert "New description." in sql
+    assert "'merge-sorted-array'" not in sql
+
+def test_tag_diff_deletes_and_inserts_only_differences():
+    previous = Catalogue({"Two Pointers": BASE_ROWS}, {"Two Pointers": ["Old", "Shared"]})
+    current = Catalogue({"Two Pointers": BASE_ROWS}, {"Two Pointers": ["Shared", "New"]})
+    sql = incremental_sql(previous, current)
+
+    assert "AND tag IN ('Old')" in sql
+    assert "('merge-sorted-array', 'New')" in sql
+    assert "'Shared')" not in sql
+
+def test_removed_question_is_deleted_by_leetcode_id_with_guards():
+    previous = make_catalogue(BASE_ROWS)
+    current = make_catalogue(BASE_ROWS[:1])
+    sql = incremental_sql(previous, current)
+
+    assert "-- Remove valid-palindrome" in sql
+    assert "WHERE q.leetcode_id = '125'" in sql
+    assert "user_question_progress" in sql
+    assert "path_questions" in sql
+
+def test_renamed_title_moves_existing_row_before_upsert():
+    previous = make_catalogue(BASE_ROWS)
+    current = make_catalogue([(88, "Merge Two Sorted Arrays", "Easy", "Merge two sorted arrays."), BASE_ROWS[1]])
+    sql = incremental_sql(previous, current)
+
+    rename = sql.index("UPDATE questions q SET slug = v.slug")
+    upsert = sql.index("INSERT INTO questions")
+    assert rename < upsert
+    assert "('88', 'merge-two-sorted-arrays'" in sql
+    # Same leetcode_id, so nothing is removed
+    assert "DELETE FROM questions" not in sql
+
+def test_manifest_round_trip_and_old_format(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    manifest = build_manifest(make_catalogue(BASE_ROWS))
+
+    save_manifest(manifest, path)
+    assert load_manifest(path) == manifest
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"merge-sorted-array": {"hash": "x", "tags": []}}, f)
+    assert load_manifest(path) == {}
+
+def test_manifest_is_pending_until_committed(tmp_path):
+    manifest = str(tmp_path / "manifest.json")
+    output = str(tmp_path / "update.sql")
+
+    subprocess.run([sys.executable, SCRIPT, "--incremental", "--manifest", manifest, "-o", output],
+                   check=True, capture_output=True)
+    assert not os.path.exists(manifest)
+    assert os.path.exists(pending_manifest_path(manifest))
+
+    # Not committed yet, so a rerun still emits every question
+    subprocess.run([sys.executable, SCRIPT, "--incremental", "--manifest", manifest, "-o", output],
+                   check=True, capture_output=True)
+    with open(output, encoding="utf-8") as f:
+        assert "INSERT INTO questions" in f.read()
+
+    subprocess.run([sys.executable, SCRIPT, "--commit-manifest", "--manifest", manifest],
+                   check=True, capture_output=True)
+    assert os.path.exists(manifest)
+    assert not os.path.exists(pending_manifest_path(manifest))
+
+    subprocess.run([sys.executable, SCRIPT, "--incremental", "--manifest", manifest, "-o", output],
+                   check=True, capture_output=True)
+    with open(output, encoding="utf-8") as f:
+        assert "INSERT INTO questions" not in f.read()
@@ -0,0 +1,40 @@
+import json
+import os
+import subprocess
+import sys
+
+from catalogue import Catalogue
+from generate_questions import category_tags_map, generate_shards
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "generate_questions.py")
+
+ROWS = [
+    (88, "Merge Sorted Array", "Easy", "Merge two sorted arrays."),
+    (125, "Valid Palindrome", "Easy", "Check for a palindrome."),
+]
+
+def test_manifest_only_references_files_inside_shards_dir(tmp_path):
+    shards_dir = tmp_path / "shards"
+    manifest = generate_shards(Catalogue({"Two Pointers": ROWS}, category_tags_map), str(shards_dir), workers=1)
+
+    with open(shards_dir / "manifest.json", encoding="utf-8") as f:
+        assert json.load(f) == manifest
+
+    for stage in manifest["stages"]:
+        for path in stage["files"]:
+            assert not os.path.isabs(path)
+            assert not path.startswith("..")
+            assert (shards_dir / path).is_file()
+
+    path_stage = next(stage for stage in manifest["stages"] if stage["name"] == "path_questions")
+    assert path_stage["files"] == [
+        "path_questions/create-top-interview-150-path.sql",
+        "path_questions/create-graph-theory-path.sql",
+    ]
+
+def test_workers_must_be_positive(tmp_path):
+    result = subprocess.run([sys.executable, SCRIPT, "--shards-dir", str(tmp_path), "--workers", "0"],
+                            capture_output=True, text=True)
+
+    assert result.returncode == 2
+    assert "--workers must be at least 1" in result.stderr
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from catalogue import Catalogue
+from generate_questions import BUNDLED_CATALOGUE, build_catalogue, load_catalogues
+from snapshot import HEADER, Snapshot, SnapshotError, write_ndjson, write_snapshot
+
+def bundled_catalogue():
+    return build_catalogue(load_catalogues([BUNDLED_CATALOGUE], use_cache=False))
+
+def expected_row(q):
+    return {
+        "leetcode_id": q.leetcode_id,
+        "title": q.title,
+        "slug": q.slug,
+        "difficulty": q.difficulty,
+        "category": q.category,
+        "description": q.description,
+        "tags": list(q.tags),
+        "url": q.url,
+    }
+
+def test_round_trip_by_slug_and_leetcode_id(tmp_path):
+    catalogue = bundled_catalogue()
+    path = str(tmp_path / "catalogue.snap")
+    write_snapshot(catalogue, path)
+
+    with Snapshot(path) as snapshot:
+        assert len(snapshot) == len(list(catalogue))
+
+        for q in catalogue:
+            assert snapshot.find_slug(q.slug) == expected_row(q)
+            assert snapshot.find_leetcode_id(q.leetcode_id) == expected_row(q)
+
+def test_not_found(tmp_path):
+    path = str(tmp_path / "catalogue.snap")
+    write_snapshot(bundled_catalogue(), path)
+
+    with Snapshot(path) as snapshot:
+        assert snapshot.find_slug("not-a-question") is None
+        assert snapshot.find_slug("") is None
+        assert snapshot.find_slug("zzzz") is None
+        assert snapshot.find_leetcode_id(0) is None
+        assert snapshot.find_leetcode_id(10 ** 9) is None
+
+def test_empty_catalogue(tmp_path):
+    path = str(tmp_path / "empty.snap")
+    write_snapshot(Catalogue({}, {}), path)
+
+    with Snapshot(path) as snapshot:
+        assert len(snapshot) == 0
+        assert snapshot.find_slug("two-sum") is None
+        assert snapshot.find_leetcode_id(1) is None
+
+def test_ndjson_has_no_database_id(tmp_path):
+    catalogue = bundled_catalogue()
+    path = str(tmp_path / "catalogue.ndjson")
+    write_ndjson(catalogue, path)
+
+    with open(path, encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+
+    assert len(rows) == len(list(catalogue))
+    assert all("id" not in row for row in rows)
+    assert rows[0]["leetcode_id"] == str(next(iter(catalogue)).leetcode_id)
+
+def test_empty_file_is_rejected(tmp_path):
+    path = tmp_path / "empty.snap"
+    path.write_bytes(b"")
+
+    with pytest.raises(SnapshotError, match="not a catalogue snapshot"):
+        Snapshot(str(path))
+
+def test_truncated_file_is_rejected(tmp_path):
+    path = tmp_path / "catalogue.snap"
+    write_snapshot(bundled_catalogue(), str(path))
+    data = path.read_bytes()
+
+    for size in (HEADER.size, HEADER.size + 100, len(data) // 2, len(data) - 1):
+        path.write_bytes(data[:size])
+        with pytest.raises(SnapshotError, match="truncated or corrupt"):
+            Snapshot(str(path))
+
+def test_offsets_outside_the_file_are_rejected(tmp_path):
+    path = tmp_path / "catalogue.snap"
+    write_snapshot(bundled_catalogue(), str(path))
+    data = bytearray(path.read_bytes())
+
+    magic, version, rows, categories, *offsets, strings_size = HEADER.unpack_from(data)
+    HEADER.pack_into(data, 0, magic, version, rows, categories, *offsets, strings_size + 1)
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(SnapshotError, match="truncated or corrupt"):
+        Snapshot(str(path))
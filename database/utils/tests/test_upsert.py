@@ -0,0 +1,22 @@
+from catalogue import Catalogue
+from generate_questions import category_tags_map, generate_upsert, write_shard
+
+ROWS = [(167, "Two Sum II - Input Array Is Sorted", "Medium", "Find two numbers.")]
+
+def test_upsert_moves_rows_by_leetcode_id_before_slug_upsert():
+    sql = "".join(generate_upsert(Catalogue({"Two Pointers": ROWS}, category_tags_map)))
+
+    rename = sql.index("UPDATE questions q SET slug = v.slug")
+    upsert = sql.index("INSERT INTO questions")
+    assert rename < upsert
+    assert "('167', 'two-sum-ii-input-array-is-sorted'" in sql
+
+def test_shard_moves_rows_by_leetcode_id_before_slug_upsert(tmp_path):
+    (tmp_path / "questions").mkdir()
+    (tmp_path / "question_tags").mkdir()
+    catalogue = Catalogue({"Two Pointers": ROWS}, category_tags_map)
+
+    questions_file, tags_file = write_shard(str(tmp_path), 0, "two-pointers", list(catalogue), 500)
+    sql = (tmp_path / questions_file).read_text(encoding="utf-8")
+
+    assert sql.index("UPDATE questions q SET slug = v.slug") < sql.index("INSERT INTO questions")
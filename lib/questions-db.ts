@@ -32,6 +32,8 @@ export async function createQuestion(questionData: CreateQuestionRequest, create
     }
   }
 
+  await refreshQuestionStats();
+
   // Fetch the complete question with tags
   return await findQuestionById(questionResult.id) || questionResult;
 }
@@ -134,14 +136,35 @@ export async function updateQuestion(id: string, updates: UpdateQuestionRequest)
     }
   }
 
+  await refreshQuestionStats();
+
   return await findQuestionById(id);
 }
 
 export async function deleteQuestion(id: string): Promise<boolean> {
   const result = await query(`DELETE FROM questions WHERE id = $1`, [id]);
+  await refreshQuestionStats();
   return result.length === 0; // PostgreSQL returns empty array for successful DELETE
 }
 
+// undefined_table / undefined_function: database predates migrations/add_question_stats.sql
+const MISSING_STATS_CODES = ['42P01', '42883'];
+
+function isMissingQuestionStats(error: any): boolean {
+  return MISSING_STATS_CODES.includes(error?.code);
+}
+
+async function refreshQuestionStats(): Promise<void> {
+  // The write has already committed, so a failed refresh must not fail the request
+  try {
+    await query(`SELECT refresh_question_stats()`);
+  } catch (error) {
+    if (!isMissingQuestionStats(error)) {
+      console.error('Failed to refresh question stats:', error);
+    }
+  }
+}
+
 export async function searchQuestions(params: QuestionSearchParams): Promise<QuestionListResponse> {
   const whereConditions: string[] = [];
   const queryParams: any[] = [];
@@ -245,6 +268,46 @@ export async function searchQuestions(params: QuestionSearchParams): Promise<Que
 }
 
 export async function getQuestionStats(): Promise<QuestionStats> {
+  // Precomputed by the seed generator and refresh_question_stats()
+  let summary: {
+    total_questions: number;
+    easy_count: number;
+    medium_count: number;
+    hard_count: number;
+    custom_questions: number;
+    leetcode_questions: number;
+    tag_counts: Record<string, number>;
+  } | null = null;
+
+  try {
+    summary = await queryOne(`
+      SELECT total_questions, easy_count, medium_count, hard_count,
+             custom_questions, leetcode_questions, tag_counts
+      FROM question_stats
+      WHERE id
+    `);
+  } catch (error) {
+    // Fall back to live aggregation until the migration has been run
+    if (!isMissingQuestionStats(error)) {
+      throw error;
+    }
+  }
+
+  if (summary) {
+    return {
+      total_questions: summary.total_questions,
+      easy_count: summary.easy_count,
+      medium_count: summary.medium_count,
+      hard_count: summary.hard_count,
+      custom_questions: summary.custom_questions,
+      leetcode_questions: summary.leetcode_questions,
+      popular_tags: Object.entries(summary.tag_counts)
+        .map(([tag, count]) => ({ tag, count }))
+        .sort((a, b) => b.count - a.count)
+        .slice(0, 10)
+    };
+  }
+
   const stats = await queryOne<{
     total_questions: string;
     easy_count: string;